@@ -5,7 +5,7 @@ NOTE: This document is currently in draft form. It will be updated
 substantially as Prymal is being developed.
 """
 
-from prymal.core.element import Container, Text
+from prymal.elements import Container, Text
 from prymal.core.style import Style
 
 example = Container(style=Style(flex_direction="horizontal"))(
@@ -0,0 +1,64 @@
+"""
+Batch rendering throughput by number of worker processes.
+
+Renders the same set of documents serially and then on pools of growing size,
+with `render_batch` shipping the built trees and with `render_pages` building
+them in the workers, reporting documents per second and the speedup over the
+serial run, construction included.
+
+    python -m benchmarks.batch [--documents 200] [--size 2000] [--case styled]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from prymal.core.rendering.batch import render_batch, render_pages
+from prymal.core.rendering.web_renderer import render_to_string
+
+from .trees import TREES
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--size", type=int, default=2_000, help="nodes per document")
+    parser.add_argument("--case", choices=sorted(TREES), default="styled")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    build = TREES[args.case]
+
+    started = time.perf_counter()
+    for _ in range(args.documents):
+        render_to_string(build(args.size), cache=None)
+    serial = time.perf_counter() - started
+    print(f"{'serial':>10}: {args.documents / serial:8.1f} documents/s")
+
+    workers = 1
+    while workers <= args.max_workers:
+        with ProcessPoolExecutor(workers) as executor:
+            # Start the workers before timing.
+            list(executor.map(abs, range(workers)))
+            started = time.perf_counter()
+            documents = (build(args.size) for _ in range(args.documents))
+            for _ in render_batch(documents, executor=executor, encoding="utf-8"):
+                pass
+            shipped = time.perf_counter() - started
+
+            started = time.perf_counter()
+            arguments = [(args.size,)] * args.documents
+            for _ in render_pages(build, arguments, executor=executor, encoding="utf-8"):
+                pass
+            built = time.perf_counter() - started
+        print(
+            f"{workers:>2} workers: trees {args.documents / shipped:8.1f} documents/s"
+            f" ({serial / shipped:.2f}x), pages {args.documents / built:8.1f} documents/s"
+            f" ({serial / built:.2f}x)"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+HTML escaping against `html.escape`.
+
+Times both on strings typical of page text and attribute values: plain ones,
+which make up most of a page, and ones with characters to escape.
+
+    python -m benchmarks.escaping [--number 200000]
+"""
+
+import argparse
+import html
+import timeit
+
+from prymal.core.rendering.escaping import escape
+
+SAMPLES = {
+    "short": "item 42",
+    "url": "/products/shoes?page=2",
+    "sentence": "The quick brown fox jumps over the lazy dog. " * 4,
+    "special": "Tom & Jerry <b>",
+    "quoted": 'say "hi" & it\'s done',
+    "long special": ("lorem ipsum dolor sit amet " * 8 + "<br>") * 3,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args()
+
+    for name, sample in SAMPLES.items():
+        assert escape(sample) == html.escape(sample)
+        baseline = timeit.timeit(lambda: html.escape(sample), number=args.number)
+        ours = timeit.timeit(lambda: escape(sample), number=args.number)
+        print(
+            f"{name:>12}: html.escape {baseline / args.number * 1e9:6.0f} ns"
+            f"  escape {ours / args.number * 1e9:6.0f} ns  ({baseline / ours:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
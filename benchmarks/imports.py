@@ -0,0 +1,65 @@
+"""
+Import time of Prymal, with a budget.
+
+Runs an import statement in fresh interpreters under `python -X importtime`
+and reports the time spent importing Prymal's modules, the best of several
+runs. Fails when it exceeds the budget, so cold starts of render workers
+don't regress unnoticed.
+
+    python -m benchmarks.imports [--statement "from prymal.html import div"] [--budget-ms 10]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+def import_time(statement: str) -> tuple[int, list[str]]:
+    """
+    Microseconds spent importing Prymal's top level modules, with a line per
+    Prymal module imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    total = 0
+    modules: list[tuple[int, str]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip().startswith("prymal"):
+            modules.append((int(cumulative), name.rstrip()))
+        # Only top level imports, nested ones are part of their cumulative time.
+        if not name.startswith("  ") and name.strip().partition(".")[0] == "prymal":
+            total += int(cumulative)
+    return total, [f"{cumulative:>8} us {name}" for cumulative, name in modules]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--statement", default="from prymal.html import div")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    # Byte code caches are written by a first run, cold starts in production
+    # don't compile either.
+    environment = dict(os.environ)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    subprocess.run([sys.executable, "-c", args.statement], check=True, env=environment)
+
+    best, lines = min(import_time(args.statement) for _ in range(args.repeat))
+    print("\n".join(lines))
+    print(f"{args.statement}: {best / 1000:.2f} ms (budget {args.budget_ms} ms)")
+    if best > args.budget_ms * 1000:
+        print(f"import took {best / 1000:.2f} ms, more than the {args.budget_ms} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
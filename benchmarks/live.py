@@ -0,0 +1,70 @@
+"""
+Memory and event cost of live sessions.
+
+Opens sessions on a page with server listeners, as many tabs connecting to a
+live application do, and reports the bytes each of them retains: measured with
+`tracemalloc` and as estimated by `Session.memory`. Then times an event
+updating one session, from dispatch to patches.
+
+    python -m benchmarks.live [--sessions 1000] [--size 200]
+"""
+
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+from prymal.core.element import Element
+from prymal.elements import Container, Text
+from prymal.html.html_tags import button, p
+from prymal.live import Sessions, handle
+
+from .render import best_of
+from .trees import TREES
+
+
+def page(size: int) -> Element:
+    counter = p()(Text("0"))
+
+    def clicked(event: object) -> None:
+        counter.clear_children()
+        counter(Text(str(int(time.perf_counter()))))
+
+    return Container()(
+        button().add_event_listener("click", clicked), counter, TREES["styled"](size)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=1_000)
+    parser.add_argument("--size", type=int, default=200, help="nodes per page")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sessions = Sessions(max_pending=args.sessions)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(args.sessions):
+            sessions.open(page(args.size))
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    report = sessions.report()
+    print(f"{report['sessions']} sessions of {args.size} nodes")
+    print(f"  measured: {(after - before) / args.sessions / 1024:8.1f} KiB/session")
+    print(f"  estimate: {report['bytes_per_session'] / 1024:8.1f} KiB/session")
+
+    session = next(iter(sessions.pending.values()))
+    button_id = session.root._children[0]._event_listeners.id  # type: ignore[union-attr]
+    events = [[button_id, "click", [{}]]]
+    elapsed = best_of(args.repeat, lambda: asyncio.run(handle(events, session=session)))
+    print(f"     event: {elapsed * 1000:8.2f} ms to patches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Per-node memory cost of Element trees.
+
+Builds trees of a single kind of node and reports the bytes allocated per node,
+measured with `tracemalloc`.
+
+    python -m benchmarks.memory [--nodes 100000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+from prymal.core.element import Element
+from prymal.core.traversal import preorder
+from prymal.elements import Container, Text
+from prymal.html.html_tags import table, td, tr
+
+CASES: dict[str, Callable[[int], Element]] = {
+    "text": lambda n: Container()(*(Text("cell") for _ in range(n))),
+    "container": lambda n: Container()(*(Container() for _ in range(n))),
+    "table": lambda n: table()(
+        *(tr()(*(td()(Text("cell")) for _ in range(10))) for _ in range(n // 20))
+    ),
+}
+
+
+def bytes_per_node(build: Callable[[int], Element], nodes: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tree = build(nodes)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / sum(1 for _ in preorder(tree))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for name, build in CASES.items():
+        print(f"{name:>10}: {bytes_per_node(build, args.nodes):8.1f} bytes/node")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Render benchmark suite.
+
+Builds each synthetic tree from `benchmarks.trees` and measures construction,
+render and style compilation time, peak memory and allocations per node.
+Results are written as JSON and can be compared against a saved baseline,
+failing when a metric regressed by more than the tolerance.
+
+    python -m benchmarks.render --output baseline.json
+    python -m benchmarks.render --compare baseline.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from prymal.core.element import Element
+from prymal.core.rendering.stylesheet import StyleSheet
+from prymal.core.rendering.web_renderer import render_to_string
+from prymal.core.traversal import preorder
+
+from .trees import TREES
+
+LOWER_IS_BETTER = (
+    "construct_seconds",
+    "render_seconds",
+    "styles_seconds",
+    "peak_bytes",
+    "allocations_per_node",
+)
+
+
+def best_of(repeat: int, function: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def measure(build: Callable[[int], Element], size: int, repeat: int) -> dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tree = build(size)
+        after = tracemalloc.take_snapshot()
+        render_to_string(tree, cache=None)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    nodes = sum(1 for _ in preorder(tree))
+    allocations = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    return {
+        "nodes": nodes,
+        "construct_seconds": best_of(repeat, lambda: build(size)),
+        "render_seconds": best_of(repeat, lambda: render_to_string(tree, cache=None)),
+        "styles_seconds": best_of(repeat, lambda: StyleSheet().collect(tree)),
+        "peak_bytes": peak,
+        "allocations_per_node": allocations / nodes,
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> bool:
+    """
+    Prints the change of every metric against the baseline, returns `False`
+    when any of them regressed by more than `tolerance`.
+    """
+    passed = True
+    for case, metrics in results["cases"].items():
+        previous = baseline["cases"].get(case)
+        if previous is None:
+            continue
+        for metric in LOWER_IS_BETTER:
+            if not previous.get(metric):
+                continue
+            change = metrics[metric] / previous[metric] - 1
+            regressed = change > tolerance
+            passed &= not regressed
+            flag = "REGRESSION" if regressed else ""
+            print(f"{case:>8} {metric:>22}: {change:+8.1%} {flag}")
+    return passed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10_000, help="nodes per tree")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--case", action="append", choices=TREES, help="default: all")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "size": args.size,
+        "cases": {},
+    }
+    for case in args.case or TREES:
+        results["cases"][case] = measure(TREES[case], args.size, args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Binary tree format against pickle: encoded size and encode/decode time.
+
+    python -m benchmarks.serialization [--size 2000] [--repeat 5]
+"""
+
+import argparse
+import pickle
+
+from prymal.core.serialization import dumps, loads
+
+from .render import best_of
+from .trees import TREES
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, build in TREES.items():
+        tree = build(args.size)
+        data = dumps(tree)
+        line = (
+            f"{name:>8}: {len(data):>8} bytes"
+            f"  encode {best_of(args.repeat, lambda: dumps(tree)) * 1000:6.2f} ms"
+            f"  decode {best_of(args.repeat, lambda: loads(data)) * 1000:6.2f} ms"
+        )
+        try:
+            pickled = pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)
+        except (RecursionError, TypeError) as error:
+            print(f"{line}  | pickle fails: {type(error).__name__}")
+            continue
+        print(
+            f"{line}  | pickle {len(pickled):>8} bytes"
+            f"  encode {best_of(args.repeat, lambda: pickle.dumps(tree, -1)) * 1000:6.2f} ms"
+            f"  decode {best_of(args.repeat, lambda: pickle.loads(pickled)) * 1000:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
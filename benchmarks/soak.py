@@ -0,0 +1,64 @@
+"""
+Soak test for render-time memory leaks.
+
+Builds and renders a page over and over, as a long running server does for
+every request, and fails when traced memory keeps growing after warm up.
+
+    python -m benchmarks.soak [--iterations 1000000]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+
+from prymal.core.element import Element
+from prymal.core.rendering.web_renderer import render_to_string
+from prymal.core.style import Style
+from prymal.elements import Container, Text
+from prymal.html.html_tags import a, li, nav, ul
+
+emphasis = Style(font_weight="bold") & Style(color="red")
+
+
+def page(number: int) -> Element:
+    return Container()(
+        nav()(ul()(*(li()(a(href=f"/{item}")(Text(item))) for item in ("home", "about")))),
+        Text(f"request {number}") @ emphasis,
+        Container()(*(Text(f"row {row}") for row in range(10))),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=1_000_000)
+    parser.add_argument("--warmup", type=int, default=1_000)
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument(
+        "--max-growth", type=int, default=64 * 1024, help="allowed growth in bytes after warm up"
+    )
+    args = parser.parse_args()
+
+    for number in range(args.warmup):
+        render_to_string(page(number))
+
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    interval = max(args.iterations // args.samples, 1)
+    growth = 0
+    for number in range(args.iterations):
+        render_to_string(page(number))
+        if (number + 1) % interval == 0:
+            gc.collect()
+            growth = tracemalloc.get_traced_memory()[0] - baseline
+            print(f"{number + 1:>10} renders: {growth:+10d} bytes")
+    tracemalloc.stop()
+
+    if growth > args.max_growth:
+        print(f"memory grew by {growth} bytes, more than {args.max_growth}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Cost of composing styles per row.
+
+Combines a shared base style with a style unique to each row, as big tables
+styled per row do, and reports the time and the bytes allocated per `&`, for
+base styles of several sizes. Every row misses the combination cache, so this
+measures building combined styles rather than looking them up.
+
+    python -m benchmarks.styles [--rows 10000] [--sizes 4 12 40]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from prymal.core.style import Style, StyleProperty
+
+
+def base_style(size: int) -> Style:
+    return Style(*(StyleProperty(f"--base-{index}", index) for index in range(size)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 12, 40])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        base = base_style(size)
+        rows = [Style(width=f"{index}px") for index in range(args.rows)]
+        gc.collect()
+        start = time.perf_counter()
+        combined = [base & row for row in rows]
+        elapsed = time.perf_counter() - start
+        del combined
+
+        # Other rows, the first ones are in the combination cache now.
+        rows = [Style(width=f"{index}px", height=f"{index}px") for index in range(args.rows)]
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            combined = [base & row for row in rows]
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        del combined
+
+        print(
+            f"{size:>4} properties: {elapsed / args.rows * 1e6:6.2f} us "
+            f"{(after - before) / args.rows:8.0f} bytes per combination"
+        )
+
+
+if __name__ == "__main__":
+    main()
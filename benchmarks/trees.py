@@ -0,0 +1,65 @@
+"""
+Synthetic trees shaped like the pages Prymal renders.
+"""
+
+from collections.abc import Callable
+
+from prymal.core.element import Element
+from prymal.core.style import Style
+from prymal.elements import Container, Text
+from prymal.html.html_tags import table, td, th, thead, tbody, tr
+
+
+def wide(size: int) -> Element:
+    """A single container holding `size` text leaves."""
+    return Container()(*(Text(f"item {index}") for index in range(size)))
+
+
+def deep(size: int) -> Element:
+    """`size` containers nested in one another."""
+    root = node = Container()
+    for _ in range(size - 1):
+        child = Container()
+        node(child)
+        node = child
+    node(Text("leaf"))
+    return root
+
+
+def grid(size: int, columns: int = 10) -> Element:
+    """A table with `columns` cells per row and about `size` cells in total."""
+    rows = max(size // columns, 1)
+    return table()(
+        thead()(tr()(*(th()(Text(f"column {column}")) for column in range(columns)))),
+        tbody()(
+            *(
+                tr()(*(td()(Text(f"{row}:{column}")) for column in range(columns)))
+                for row in range(rows)
+            )
+        ),
+    )
+
+
+_PALETTE = [Style(color=color) for color in ("red", "green", "blue", "black")]
+_WEIGHTS = [Style(font_weight=weight) for weight in ("normal", "bold")]
+_SPACING = [Style(padding=f"{size}px") for size in (0, 4, 8)]
+
+
+def styled(size: int) -> Element:
+    """Text leaves each combining a handful of shared styles with `&`."""
+    return Container()(
+        *(
+            Text(f"item {index}") @ _PALETTE[index % len(_PALETTE)]
+            & _WEIGHTS[index % len(_WEIGHTS)]
+            & _SPACING[index % len(_SPACING)]
+            for index in range(size)
+        )
+    )
+
+
+TREES: dict[str, Callable[[int], Element]] = {
+    "wide": wide,
+    "deep": deep,
+    "table": grid,
+    "styled": styled,
+}
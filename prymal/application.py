@@ -1,3 +1,269 @@
 """
 Core application functionality.
+
+`Application` serves Prymal pages through Litestar. Pages are streamed to the
+client while they are being rendered, so a request never holds a full document
+in memory. With `etags`, each response also carries an ETag computed from the
+structure of the page rather than from its rendered bytes.
+
+Pages with server side event listeners get a small script forwarding browser
+events to `EVENTS_PATH`, where they are dispatched through the event registry.
+The browser sends the events it coalesced in a single request, answered with
+the patches updating the page once all their listeners ran. The application
+keeps the most recent of these pages alive so their listeners can still be
+reached once the response is sent, each under a random token sent along with
+the page: a request only reaches the elements of the page its token names. In
+live mode each of these pages gets a session and a websocket instead, see
+`prymal.live`.
 """
+
+import json
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterator
+from importlib.util import find_spec
+from typing import Any, Literal, TypeAlias
+
+from litestar import Litestar, Request, Response, get, post, websocket
+from litestar.config.compression import CompressionConfig
+from litestar.enums import MediaType
+from litestar.handlers import BaseRouteHandler
+from litestar.response import Stream
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+)
+from litestar.types import Receive, Scope, Send
+
+from .component import pending, resolve
+from .core.element import Element
+from .core.events import EVENT_SCRIPT, EVENT_TYPES
+from .core.rendering.diff import PATCH_SCRIPT, dumps
+from .core.rendering.web_renderer import DEFAULT_CHUNK_SIZE, render, render_async
+from .core.traversal import preorder
+from .live import LIVE_PATH, Session, Sessions, handle, parse_events
+
+Page: TypeAlias = Callable[..., Element]
+"""A component class or any callable building a page from its path parameters."""
+
+Compression: TypeAlias = Literal["gzip", "brotli"]
+
+_DOCTYPE = b"<!DOCTYPE html>"
+
+EVENTS_PATH = "/_prymal/events"
+"""
+Endpoint receiving browser events at `EVENTS_PATH/<page token>`, as a JSON list
+of `[element_id, name, batch]`, `batch` being the data of the coalesced events.
+"""
+
+
+def _listens(root: Element) -> bool:
+    return any(
+        element._event_listeners is not None and element._event_listeners.id is not None
+        for element in preorder(root)
+    )
+
+
+def _event_shim(root: Element, transport: str) -> bytes:
+    mount = "document" if root.tag_name == "html" else "document.body"
+    return (
+        f"<script>{PATCH_SCRIPT}{EVENT_SCRIPT}prymalEvents({transport}, "
+        f"{json.dumps(EVENT_TYPES)}, {mount});</script>"
+    ).encode()
+
+
+def _compression_config(compression: Compression | None) -> CompressionConfig | None:
+    if compression is None:
+        return None
+    # Brotli is optional, without it responses fall back to gzip.
+    if compression == "brotli" and find_spec("brotli") is not None:
+        return CompressionConfig(backend="brotli", brotli_gzip_fallback=True)
+    return CompressionConfig(backend="gzip", gzip_compress_level=6)
+
+
+def etag(root: Element, atomic_styles: bool = False) -> str:
+    """
+    Weak entity tag of a page, derived from its digest so a response can be
+    validated without rendering it. It is weak because compression changes
+    the bytes sent for the same page.
+    """
+    return f'W/"{root.digest.hex()}{"a" if atomic_styles else ""}"'
+
+
+def _none_match(header: str, tag: str) -> bool:
+    """
+    Whether an `If-None-Match` header matches `tag`, comparing weakly as
+    conditional GETs do.
+    """
+    if header.strip() == "*":
+        return True
+    opaque = tag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+class Application:
+    """
+    Mounts Prymal pages as Litestar route handlers.
+
+    Example usage:
+
+    ```py
+    app = Application()
+
+
+    @app.page("/")
+    def index() -> Element:
+        return Container()(Text("Hello World!"))
+    ```
+
+    The application is an ASGI app and can be handed to any ASGI server.
+    Extra keyword arguments are forwarded to `Litestar`.
+
+    `etags` validates pages with ETags, answering requests that already have
+    the page with a 304. Computing one hashes the whole page, which costs
+    about as much as rendering it: it pays off for large pages that rarely
+    change, and costs CPU for the others.
+
+    Up to `retained_pages` pages with server listeners are kept in memory,
+    events sent by older pages are answered with a 404. With `live`, these
+    pages are kept for as long as their tab is connected instead.
+    """
+
+    def __init__(
+        self,
+        *,
+        compression: Compression | None = "gzip",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        atomic_styles: bool = False,
+        etags: bool = False,
+        retained_pages: int = 1024,
+        live: bool = False,
+        **litestar_options: Any,
+    ) -> None:
+        self.compression = compression
+        self.chunk_size = chunk_size
+        self.atomic_styles = atomic_styles
+        self.etags = etags
+        self.litestar_options = litestar_options
+        self.retained_pages = retained_pages
+        self.retained: OrderedDict[str, Session] = OrderedDict()
+        self.sessions: Sessions | None = None
+        self.route_handlers: list[BaseRouteHandler] = []
+        # Live sessions only take events from their socket, so their tab and
+        # their tree can't drift apart.
+        if live:
+            self.sessions = Sessions(atomic_styles)
+            socket = websocket(LIVE_PATH, name="prymal-live")(self.sessions.serve)
+            self.route_handlers.append(socket)
+        else:
+            events = post(f"{EVENTS_PATH}/{{page:str}}", name="prymal-events")(self.dispatch)
+            self.route_handlers.append(events)
+        self.pages: dict[str, Page] = {}
+        self._asgi: Litestar | None = None
+
+    def page(self, path: str, **handler_options: Any) -> Callable[[Page], Page]:
+        """
+        Decorator registering a page under `path`. Path parameters declared in
+        the path, e.g. `/users/{user_id:int}`, are passed as keyword arguments.
+        """
+
+        def decorator(page: Page) -> Page:
+            self.mount(path, page, **handler_options)
+            return page
+
+        return decorator
+
+    def mount(self, path: str, page: Page, **handler_options: Any) -> None:
+        """
+        Registers a page under `path`.
+        """
+        if self._asgi is not None:
+            raise RuntimeError("Pages must be mounted before the application starts serving")
+
+        self.pages[path] = page
+
+        async def handler(request: Request) -> Response:
+            root = await resolve(self.pages[path](**request.path_params), defer=True)
+            if pending(root):
+                # Deferred content isn't known yet, the page can't be validated.
+                return Stream(self.stream_async(root), media_type=MediaType.HTML)
+            if not self.etags:
+                return Stream(self.stream(root), media_type=MediaType.HTML)
+
+            tag = etag(root, self.atomic_styles)
+            if _none_match(request.headers.get("if-none-match", ""), tag):
+                return Response(b"", status_code=HTTP_304_NOT_MODIFIED, headers={"ETag": tag})
+            return Stream(self.stream(root), media_type=MediaType.HTML, headers={"ETag": tag})
+
+        handler_options.setdefault("name", getattr(page, "__qualname__", path))
+        self.route_handlers.append(get(path, **handler_options)(handler))
+
+    async def dispatch(self, request: Request, page: str) -> Response:
+        """
+        Runs the server listeners of a batch of browser events sent by the
+        page retained under the token `page` and answers with the patches
+        updating it, computed once for the whole batch. A 404 tells the browser
+        the page or its elements don't exist anymore, a 400 that the batch is
+        malformed.
+        """
+        session = self.retained.get(page)
+        if session is None:
+            return Response(b"", status_code=HTTP_404_NOT_FOUND)
+        try:
+            events = parse_events(await request.body() or b"[]")
+        except ValueError as error:
+            return Response(str(error).encode(), status_code=HTTP_400_BAD_REQUEST)
+        patches = await handle(events, session=session, atomic_styles=self.atomic_styles)
+        if patches is None:
+            return Response(b"", status_code=HTTP_404_NOT_FOUND)
+        return Response(dumps(patches).encode(), status_code=HTTP_200_OK, media_type=MediaType.JSON)
+
+    def stream(self, root: Element) -> Iterator[bytes]:
+        """
+        Encoded chunks of a page, a full document starts with its doctype.
+        """
+        if root.tag_name == "html":
+            yield _DOCTYPE
+        yield from render(
+            root, encoding="utf-8", chunk_size=self.chunk_size, atomic_styles=self.atomic_styles
+        )
+        if _listens(root):
+            yield self._event_shim(root)
+
+    async def stream_async(self, root: Element) -> AsyncIterator[bytes]:
+        """
+        Same as `stream`, for pages with deferred components.
+        """
+        if root.tag_name == "html":
+            yield _DOCTYPE
+        async for chunk in render_async(
+            root, chunk_size=self.chunk_size, atomic_styles=self.atomic_styles
+        ):
+            yield chunk.encode()
+        if _listens(root):
+            yield self._event_shim(root)
+
+    def _event_shim(self, root: Element) -> bytes:
+        if self.sessions is not None:
+            return _event_shim(root, self.sessions.script(self.sessions.open(root)))
+        session = Session(root)
+        self.retained[session.id] = session
+        if len(self.retained) > self.retained_pages:
+            self.retained.popitem(last=False)
+        return _event_shim(root, f"prymalPost({json.dumps(f'{EVENTS_PATH}/{session.id}')})")
+
+    @property
+    def asgi(self) -> Litestar:
+        """
+        The underlying Litestar application, created on first use.
+        """
+        if self._asgi is None:
+            options = dict(self.litestar_options)
+            options.setdefault("compression_config", _compression_config(self.compression))
+            options["route_handlers"] = [*options.get("route_handlers", ()), *self.route_handlers]
+            self._asgi = Litestar(**options)
+        return self._asgi
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.asgi(scope, receive, send)
@@ -0,0 +1,32 @@
+"""
+Command line interface, installed as `prymal`.
+"""
+
+import argparse
+from pathlib import Path
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="prymal")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    dev = commands.add_parser("dev", help="serve an application and hot reload it on changes")
+    dev.add_argument("app", help="the application to serve, as module:attribute")
+    dev.add_argument("--host", default="127.0.0.1")
+    dev.add_argument("--port", type=int, default=8000)
+    dev.add_argument(
+        "--watch",
+        type=Path,
+        action="append",
+        help="directory to watch, may be repeated (default: the working directory)",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "dev":
+        from .dev import run
+
+        run(args.app, args.watch or [Path.cwd()], args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,177 @@
 Component class and implementation
 """
 
+import asyncio
+from collections.abc import Hashable
+from typing import Any, TypeGuard
+
+from .core.element import Element
 from .core.style import Style
+from .core.traversal import preorder
 
 _base_style = Style()
 
 
-class Component:
-    """Outlines the functionality of a Prymal Component"""
+class _ComponentMeta(type):
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        component = super().__call__(*args, **kwargs)
+        if component.loads:
+            return component
+        key = component.cache_key() if component.memoized else None
+        if key is None:
+            component.build()
+        else:
+            # Built by the renderer, only when the fragment cache misses.
+            component.memoize(key)
+        return component
+
+
+class Component(Element, metaclass=_ComponentMeta):
+    """
+    Outlines the functionality of a Prymal Component
+
+    Subclasses describe their content by implementing `render`. The element it
+    returns becomes the component's child as soon as the component has been
+    constructed, the component itself adds no tag to the output and its style
+    is applied to the rendered element instead.
+
+    Setting `memoized = True` opts every instance into the fragment cache.
+    Components implementing `cache_key` are then looked up by that key before
+    their content is built, see `unbuilt`.
+
+    Components fetching data implement `async def load()`. Their content is
+    only built once `resolve` has awaited the load, so `render` can use the
+    data it stored on the component. Setting `deferred = True` as well lets
+    `render_async` stream the rest of the page without waiting for it.
+    """
+
+    tag_name = None  # type: ignore[assignment]
+    memoized: bool = False
+    loads: bool = False
+    """Whether the class implements `load`, set automatically."""
+    deferred: bool = False
+    _loading: "asyncio.Future[None] | None" = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.loads = cls.load is not Component.load
 
     def __init__(self, style: Style = _base_style) -> None:
-        self.style = style
+        super().__init__(style)
+
+    async def load(self) -> None:
+        """
+        Fetches the data the component renders, awaited before `build`.
+        """
+
+    def fallback(self) -> Element | None:
+        """
+        Shown in place of a deferred component while it loads.
+        """
+        return None
+
+    def render(self) -> Element:
+        raise NotImplementedError
+
+    def cache_key(self) -> Hashable | None:
+        """
+        Key of the content of a memoized component in the fragment cache,
+        along with its class. It must capture everything `render` depends on.
+        `None` caches the content by its digest instead, once built.
+        """
+        return None
+
+    def build(self) -> None:
+        """
+        Renders the component's content and attaches it as its child.
+        """
+        root = self.render()
+        if self.style.key:
+            root @= self.style
+        self(root)
+        if self.memoized and not self._memoize:
+            self.memoize(self.cache_key())
+
+
+def unbuilt(element: Element) -> bool:
+    """
+    Whether `element` is a memoized component with a cache key whose content
+    hasn't been built. The renderer builds it if the fragment cache misses,
+    passes needing its content call `build_all` first.
+    """
+    return (
+        isinstance(element, Component)
+        and not element.loads
+        and isinstance(element._memoize, tuple)
+        and not element._children
+    )
+
+
+def build_all(root: Element) -> Element:
+    """
+    Builds every `unbuilt` component of the tree, then returns the tree.
+    """
+    for element in preorder(root):
+        if unbuilt(element):
+            element.build()  # type: ignore[attr-defined]
+    return root
+
+
+def pending(root: Element) -> list[Component]:
+    """
+    Components of the tree waiting for their load, the topmost ones only since
+    a pending component has no children yet.
+    """
+
+    def waiting(element: Element) -> TypeGuard[Component]:
+        return isinstance(element, Component) and element.loads and not element._children
+
+    return [element for element in preorder(root, waiting) if waiting(element)]
+
+
+async def _resolve(component: Component, defer: bool) -> None:
+    await component.load()
+    component.build()
+    await _resolve_all(component, defer)
+
+
+async def _resolve_all(root: Element, defer: bool) -> None:
+    components = pending(root)
+    if defer:
+        for component in components:
+            if component.deferred and component._loading is None:
+                component._loading = asyncio.ensure_future(component.load())
+        components = [component for component in components if not component.deferred]
+    await asyncio.gather(*(_resolve(component, defer) for component in components))
+
+
+async def resolve(root: Element, defer: bool = False) -> Element:
+    """
+    Loads and builds every component of the tree implementing `load`, then
+    returns the tree.
+
+    Loads run concurrently: siblings fetch in parallel and a component's
+    children start loading as soon as it has been built, without waiting for
+    unrelated loads elsewhere in the tree.
+
+    With `defer=True` deferred components aren't waited for, their load is
+    started in the background and they stay `pending` until
+    `resolve_deferred` completes them.
+    """
+    await _resolve_all(root, defer)
+    return root
+
+
+async def resolve_deferred(component: Component) -> Component:
+    """
+    Waits for the background load of a deferred component, then replaces its
+    children (its placeholder) with its content. Deferred components inside
+    that content are left pending.
+    """
+    if component._loading is None:
+        component._loading = asyncio.ensure_future(component.load())
+    await component._loading
+    component.clear_children()
+    component.build()
+    await _resolve_all(component, True)
+    return component
@@ -1,26 +1,105 @@
 """Core HTML Functionality"""
 
-from collections import defaultdict
-from collections.abc import Callable, Iterable
-from typing import Self, TypeAlias
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from typing import Any, Self, TypeAlias
 
+try:
+    # hashlib's blake2b, imported without hashlib's OpenSSL bindings which take
+    # longer to load than the rest of the package.
+    from _blake2 import blake2b
+except ImportError:  # A CPython implementation detail, other builds may lack it.
+    from hashlib import blake2b
+
+from .events import EventListeners, Listener
 from .style import Style
+from .traversal import postorder
 from .utils import AbstractHashable
 
 ElementType: TypeAlias = "Element"
 
+_NO_CHILDREN: tuple[ElementType, ...] = ()
+"""Shared by every element without children, replaced by a list on first append."""
+
+
+class _NoAttributes(Mapping[str, Any]):
+    """
+    An empty, read-only mapping, pickled by reference so unpickled elements
+    share it as well.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, name: str) -> Any:
+        raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+    def __reduce__(self) -> str:
+        return "_NO_ATTRIBUTES"
+
+
+_NO_ATTRIBUTES: Mapping[str, Any] = _NoAttributes()
+"""Shared by every HTML element created without attributes."""
+
+VOID_ELEMENTS = frozenset("area base br col embed hr img input link meta source track wbr".split())
+"""Tags without content nor closing tag."""
+
 
 class Element(AbstractHashable):
     """
     Base element class from which all other elements derive from.
+
+    Elements use `__slots__` to keep large trees small: subclasses must declare
+    `__slots__` as well, listing any attribute they add. Children and event
+    listeners are only allocated once an element actually has some.
+
+    `key` identifies an element among its siblings when diffing two trees,
+    elements without one are matched by identity and then by position.
     """
 
+    __slots__ = (
+        "parent",
+        "_children",
+        "_event_listeners",
+        "style",
+        "_digest",
+        "_memoize",
+        "key",
+    )
+
+    tag_name: str = "div"
+    self_closing: bool = False
+    text: tuple[str, ...] = ()
+
+    _tag_start: str | None = "<div"
+    """`<tag`, precomputed for classes with a fixed tag, `None` otherwise."""
+    _tag_end: str | None = "</div>"
+    """The closing tag, empty for self closing elements."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Subclasses declaring `tag_name` as a slot or property set it per
+        # instance, their tags are formatted when rendered.
+        tag_name = cls.tag_name
+        if isinstance(tag_name, str) and isinstance(cls.self_closing, bool):
+            cls._tag_start = f"<{tag_name}"
+            cls._tag_end = "" if cls.self_closing else f"</{tag_name}>"
+        else:
+            cls._tag_start = cls._tag_end = None
+
     def __init__(self, style: Style = Style(), *children: ElementType) -> None:
         self.parent: ElementType = self
-        self._children: list[Element] = []
-        self.event_listeners: dict[str, list[Callable]] = defaultdict(list)
+        self._children: list[Element] | tuple[Element, ...] = _NO_CHILDREN
+        self._event_listeners: EventListeners | None = None
         self.style: Style = style
-        self.style._elements.add(self)
+        self._digest: bytes | None = None
+        self._memoize: bool | tuple[type, Hashable] = False
+        self.key: Hashable | None = None
+        self(*children)
 
     @property
     def children(self) -> Iterable[ElementType]:
@@ -29,45 +108,181 @@ class Element(AbstractHashable):
         """
         return iter(self._children)
 
+    @property
+    def attributes(self) -> Mapping[str, Any]:
+        """
+        HTML attributes rendered on the element's tag.
+        """
+        return _NO_ATTRIBUTES
+
+    @property
+    def event_listeners(self) -> EventListeners:
+        if self._event_listeners is None:
+            self._event_listeners = EventListeners(self)
+        return self._event_listeners
+
     def clear_children(self) -> None:
-        self._children.clear()
+        self._children = _NO_CHILDREN
+        self._invalidate()
 
-    def add_event_listener(self) -> None:
-        """Allows for adding event listeners such as on_hover or clicked"""
-        ...
+    def add_event_listener(self, name: str, listener: Listener) -> Self:
+        """
+        Listens to the DOM event `name` (`"click"`, `"input"`...). Callables
+        run on the server and receive a `BaseEvent`, strings are JavaScript run
+        by the browser.
+        """
+        self.event_listeners.add(name, listener)
+        self._invalidate()
+        return self
 
     def __call__(self, *children: ElementType) -> Self:
         """
         Used for adding children to the element.
         """
-        self._children.extend(children)
+        if not children:
+            return self
+        for child in children:
+            child.parent = self
+        if isinstance(self._children, list):
+            self._children.extend(children)
+        else:
+            self._children = [*self._children, *children]
+        self._invalidate()
         return self
 
     def clear_style(self) -> Self:
         self.style = Style()
+        self._invalidate()
         return self
 
     def __matmul__(self, style: Style) -> Self:
-        self.style &= style
+        self.style = self.style & style
+        self._invalidate()
         return self
 
+    def __and__(self, style: Style) -> Self:
+        """
+        `@` binds tighter than `&`, so `Text() @ emphasis & bold` ends up
+        combining the element with `bold`, which adds it to the element's style.
+        """
+        return self @ style
+
     def append_element(self, element: ElementType) -> None:
-        self._children.append(element)
+        self(element)
 
     def append_elements(self, *elements: ElementType) -> None:
-        self._children.extend(elements)
+        self(*elements)
 
     def __add__(self, other: ElementType) -> Self:
-        self._children.append(other)
-        other.parent = self
+        self(other)
+        return self
+
+    def __iadd__(self, element: ElementType) -> Self:
+        self(element)
         return self
 
-    def __iadd__(self, element: Self) -> None:
-        self._children.append(element)
-        element.parent = self
+    def memoize(self, key: Hashable | None = None) -> Self:
+        """
+        Opts the element into the fragment cache: once rendered, its HTML is
+        reused for as long as its subtree keeps the same structure.
 
-    def __render(self, pretty=True, indent=2) -> str:
+        Telling whether it did means hashing the subtree on every render, which
+        only pays off for trees kept across renders. With a `key` the HTML is
+        cached under the element's class and `key` instead, a lookup costing
+        nothing: the key must then determine the content of the subtree,
+        changing the subtree doesn't invalidate its cached HTML.
+        """
+        self._memoize = True if key is None else (self.__class__, key)
+        return self
+
+    @property
+    def digest(self) -> bytes:
+        """
+        Structural hash of the subtree: tag, attributes, style, text and the
+        digests of all children. Digests are cached per element and reset for
+        the element and its ancestors whenever children, style, attributes or
+        text change through the element's methods.
+        """
+        if self._digest is None:
+            for element in postorder(self, prune=lambda element: element._digest is not None):
+                if element._digest is None:
+                    element._digest = element._compute_digest()
+        return self._digest  # type: ignore[return-value]
+
+    def _compute_digest(self) -> bytes:
+        digest = blake2b(digest_size=16)
+        digest.update(
+            repr(
+                (
+                    self.__class__.__qualname__,
+                    self.tag_name,
+                    sorted(self.attributes.items()),
+                    self.style.key,
+                    self.text,
+                    self._memoize,
+                    self._event_listeners and sorted(self._event_listeners.attributes().items()),
+                )
+            ).encode()
+        )
+        for child in self._children:
+            digest.update(child.digest)
+        return digest.digest()
+
+    def _invalidate(self) -> None:
+        # A cached digest implies cached digests for the whole subtree, so the
+        # walk up can stop at the first ancestor that has none.
+        element = self
+        while element._digest is not None:
+            element._digest = None
+            if element.parent is element:
+                break
+            element = element.parent
+
+    def render_html(self, pretty: bool = False, indent: int = 2) -> str:
         """
         Renders the element for web
         """
-        ...
+        from .rendering.web_renderer import render_to_string
+
+        return render_to_string(self, pretty=pretty, indent=indent)
+
+
+class HTMLElement(Element):
+    """
+    Base class for the raw HTML tags found in `prymal.html`. Keyword
+    arguments become attributes of the tag, trailing underscores are dropped
+    and the remaining underscores become dashes (`class_` -> `class`,
+    `http_equiv` -> `http-equiv`).
+
+    The tag is named after the class, leading and trailing underscores
+    stripped (`_del` -> `del`, `input_` -> `input`), unless the class sets
+    `tag_name`. Void elements are self closing. Subclasses of a tag keep its
+    name.
+    """
+
+    __slots__ = ("_attributes",)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        if "tag_name" not in cls.__dict__ and HTMLElement in cls.__bases__:
+            cls.tag_name = cls.__name__.strip("_")
+            if "self_closing" not in cls.__dict__:
+                cls.self_closing = cls.tag_name in VOID_ELEMENTS
+        super().__init_subclass__(**kwargs)
+
+    def __init__(self, style: Style = Style(), *children: ElementType, **attributes: Any) -> None:
+        super().__init__(style, *children)
+        self._attributes: Mapping[str, Any] = attributes or _NO_ATTRIBUTES
+
+    @property
+    def attributes(self) -> Mapping[str, Any]:
+        return self._attributes
+
+    def set_attribute(self, name: str, value: Any) -> Self:
+        """
+        Sets an attribute, `None` or `False` leaving it out of the tag. The
+        mapping is replaced rather than updated, so snapshots of the tree can
+        share it.
+        """
+        self._attributes = {**self._attributes, name: value}
+        self._invalidate()
+        return self
@@ -1,13 +1,33 @@
 """
 Events are things that can happen to an Element, such as being clicked,
 hovered, or gaining or losing focus.
+
+Server side listeners are plain Python callables receiving a `BaseEvent`. An
+element with such listeners is registered once in `registry` under an ID of
+its own, which is rendered on its tag along with the names of the events it
+listens to. The browser sends that ID and the event name back, so dispatching
+an event is a dictionary lookup rather than a search through the tree.
+
+The registry only holds listeners weakly: once their element is garbage
+collected they disappear from it as well.
+
+High frequency events (`input`, `scroll`, `mousemove`...) can be rate limited
+per listener with `event(debounce=...)`, `event(throttle=...)` or
+`event(batch=...)`. The browser then coalesces them before sending, and a
+batch reaches the listeners as a single event.
 """
 
 from __future__ import annotations
 
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
 from enum import IntEnum, auto
-from functools import wraps
-from typing import Callable, ParamSpec, TypeVar
+from itertools import count
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeAlias, TypeVar, cast
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from .element import Element
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -18,24 +38,265 @@ class EventType(IntEnum):
     Server = auto()
 
 
+class Rate(IntEnum):
+    Debounce = auto()
+    """Only the last event, once none happened for the period."""
+    Throttle = auto()
+    """At most one event per period, the first and then the latest."""
+    Batch = auto()
+    """Every event of the period, delivered together."""
+
+
 class BaseEvent:
     """
     Base event from which all other events are derived from.
+
+    `target` is the element the listener was added to and `data` what the
+    browser sent along: the value of form fields, the key pressed or the
+    pointer position, depending on the event. `batch` holds the data of every
+    event coalesced into this one, oldest first, `data` being the last of them.
     """
 
-    ...
+    __slots__ = ("name", "target", "data", "batch")
+
+    def __init__(
+        self,
+        name: str,
+        target: Element,
+        data: dict[str, Any],
+        batch: list[dict[str, Any]] | None = None,
+    ) -> None:
+        self.name = name
+        self.target = target
+        self.data = data
+        self.batch = [data] if batch is None else batch
+
+
+Handler: TypeAlias = Callable[[BaseEvent], Awaitable[None] | None]
+"""A server side listener, either sync or async."""
+
+Listener: TypeAlias = Handler | str
+"""A listener, strings are JavaScript run by the browser."""
 
 
 def event(
-    f: Callable[P, T],
+    function: Callable[P, T] | None = None,
+    /,
+    *,
     event_type: EventType = EventType.Server,
-) -> Callable[P, T]:
+    debounce: int | None = None,
+    throttle: int | None = None,
+    batch: int | None = None,
+) -> Any:
+    """
+    Declares how a listener runs, usable as `@event` or
+    `@event(event_type=...)`. Undecorated callables are server listeners.
+
+    Client listeners run in the browser: a function declared with
+    `EventType.Client` returns the JavaScript source and is called once, when
+    it is added to an element.
+
+    Server listeners take at most one rate limit, a period in milliseconds, see
+    `Rate`. It applies to every listener of the same event on the element.
+    """
+    periods = {Rate.Debounce: debounce, Rate.Throttle: throttle, Rate.Batch: batch}
+    rates = [(rate, period) for rate, period in periods.items() if period is not None]
+    if len(rates) > 1:
+        raise ValueError("A listener takes one of debounce, throttle or batch")
+    if rates and event_type is EventType.Client:
+        raise ValueError("Only server listeners can be rate limited")
+
+    def decorator(function: Callable[P, T]) -> Callable[P, T]:
+        function.event_type = event_type  # type: ignore[attr-defined]
+        function.event_rate = rates[0] if rates else None  # type: ignore[attr-defined]
+        return function
+
+    return decorator if function is None else decorator(function)
+
+
+class EventListeners(defaultdict[str, list[Listener]]):
     """
-    An event can either be in Python or another language.
+    The listeners of an element keyed by event name.
     """
 
-    @wraps(f)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        return f(*args, **kwargs)
+    __slots__ = ("element", "id", "rates", "__weakref__")
+
+    def __init__(self, element: Element) -> None:
+        super().__init__(list)
+        self.element = element
+        self.id: int | None = None
+        self.rates: dict[str, tuple[Rate, int]] = {}
 
-    return wrapper
+    def add(self, name: str, listener: Listener) -> None:
+        if getattr(listener, "event_type", EventType.Server) is EventType.Client:
+            # Client listeners are factories of their script.
+            listener = cast(Callable[[], str], listener)()
+        rate = getattr(listener, "event_rate", None)
+        if rate is not None:
+            if self.rates.get(name, rate) != rate:
+                raise ValueError(f"Listeners of {name!r} have different rate limits")
+            self.rates[name] = rate
+        self[name].append(listener)
+        if self.id is None and not isinstance(listener, str):
+            self.id = registry.register(self)
+
+    def attributes(self) -> dict[str, str | int]:
+        """
+        Attributes rendered on the element's tag: inline handlers for client
+        listeners, the registry ID, event names and rate limits for server
+        ones.
+        """
+        attributes: dict[str, str | int] = {}
+        server: list[str] = []
+        for name, listeners in self.items():
+            scripts = [listener for listener in listeners if isinstance(listener, str)]
+            if scripts:
+                attributes[f"on{name}"] = ";".join(scripts)
+            if len(scripts) < len(listeners):
+                server.append(name)
+        if server:
+            attributes["data_prymal_id"] = self.id  # type: ignore[assignment]
+            attributes["data_prymal_on"] = " ".join(server)
+        if self.rates:
+            attributes["data_prymal_rate"] = " ".join(
+                f"{name}:{rate.name[0].lower()}{period}"
+                for name, (rate, period) in self.rates.items()
+            )
+        return attributes
+
+
+class EventRegistry:
+    """
+    Maps registry IDs to the listeners of elements with server listeners.
+    """
+
+    def __init__(self) -> None:
+        self._listeners: WeakValueDictionary[int, EventListeners] = WeakValueDictionary()
+        self._ids = count(1)
+
+    def __len__(self) -> int:
+        return len(self._listeners)
+
+    def register(self, listeners: EventListeners) -> int:
+        listener_id = next(self._ids)
+        self._listeners[listener_id] = listeners
+        return listener_id
+
+    def get(self, element_id: int) -> EventListeners | None:
+        return self._listeners.get(element_id)
+
+    async def dispatch(self, element_id: int, name: str, batch: list[dict[str, Any]]) -> bool:
+        """
+        Runs the server listeners for `name` of the element registered under
+        `element_id` once, with the data of the coalesced events in `batch`.
+        Returns `False` when there are none, e.g. because the element has been
+        garbage collected since it was rendered.
+        """
+        listeners = self._listeners.get(element_id)
+        handlers = listeners.get(name) if listeners is not None else None
+        if not handlers or not batch:
+            return False
+
+        event = BaseEvent(name, listeners.element, batch[-1], batch)  # type: ignore[union-attr]
+        for handler in handlers:
+            if isinstance(handler, str):
+                continue
+            result = handler(event)
+            if isinstance(result, Awaitable):
+                await result
+        return True
+
+
+registry = EventRegistry()
+"""Registry shared by every element."""
+
+EVENT_TYPES = (
+    "click dblclick input change submit keydown keyup focusin focusout "
+    "pointerdown pointerup pointerover pointerout mousemove scroll wheel"
+).split()
+"""Events the browser shim listens to."""
+
+EVENT_SCRIPT = """
+window.prymalPost = (endpoint) => async (events) => {
+  const response = await fetch(endpoint, {
+    method: "POST",
+    headers: {"Content-Type": "application/json"},
+    body: JSON.stringify(events),
+  });
+  return response.ok ? response.json() : [];
+};
+window.prymalEvents = function (transport, types, mount) {
+  const payload = (event) => {
+    const target = event.target;
+    if (event.type === "submit") {
+      event.preventDefault();
+      return Object.fromEntries(new FormData(target));
+    }
+    const data = {};
+    if (target && "value" in target) data.value = target.value;
+    if (target && "checked" in target) data.checked = target.checked;
+    if (event.key !== undefined) data.key = event.key;
+    if (event.clientX !== undefined) Object.assign(data, {x: event.clientX, y: event.clientY});
+    return data;
+  };
+  // Events ready to be sent are flushed together in one request, requests
+  // are chained so patches are applied in order.
+  const queue = [];
+  let requests = Promise.resolve();
+  const flushQueue = async () => {
+    const patches = await transport(queue.splice(0));
+    if (patches.length) prymalPatch(mount, patches);
+  };
+  const send = (id, type, batch) => {
+    if (!queue.length) queueMicrotask(() => (requests = requests.then(flushQueue, flushQueue)));
+    queue.push([Number(id), type, batch]);
+  };
+  const rateOf = (node, type) => {
+    for (const token of (node.dataset.prymalRate || "").split(" ")) {
+      const [name, rate] = token.split(":");
+      if (name === type) return [rate[0], Number(rate.slice(1))];
+    }
+    return null;
+  };
+  const states = new Map();
+  for (const type of types) {
+    document.addEventListener(type, (event) => {
+      const node = event.target.closest && event.target.closest(`[data-prymal-on~="${type}"]`);
+      if (!node) return;
+      const id = node.dataset.prymalId;
+      const data = payload(event);
+      const rate = rateOf(node, type);
+      if (!rate) return send(id, type, [data]);
+
+      const [kind, period] = rate;
+      const key = `${id} ${type}`;
+      let state = states.get(key);
+      if (!state) states.set(key, (state = {timer: null, batch: [], last: -Infinity}));
+      const flush = () => {
+        state.timer = null;
+        state.last = performance.now();
+        send(id, type, state.batch.splice(0));
+      };
+      if (kind === "b") {
+        state.batch.push(data);
+        if (!state.timer) state.timer = setTimeout(flush, period);
+      } else if (kind === "d") {
+        state.batch = [data];
+        clearTimeout(state.timer);
+        state.timer = setTimeout(flush, period);
+      } else {
+        state.batch = [data];
+        const wait = state.last + period - performance.now();
+        if (wait <= 0 && !state.timer) flush();
+        else if (!state.timer) state.timer = setTimeout(flush, wait);
+      }
+    }, true);
+  }
+};
+"""
+"""
+Defines `prymalEvents(transport, types, mount)`, forwarding server events with
+`transport` and applying the patches it resolves to on `mount`, see
+`prymalPatch`. `prymalPost(endpoint)` is the transport posting events to
+`endpoint`.
+"""
@@ -0,0 +1,240 @@
+"""
+Persistent mappings.
+
+`PersistentMap` never changes once built: `set` and `update` return a new map
+sharing everything but the changed entries with the original one. Maps of
+fewer than `SMALL_SIZE` entries are a tuple of pairs, scanned linearly, which
+beats hashing at that size. Larger maps are hash array mapped tries: 32-way
+trees indexed by 5 bits of the key's hash per level, where an update copies
+only the nodes on the path to the changed entry.
+
+Iteration follows insertion order, replacing the value of a key keeps its
+place.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping
+from operator import itemgetter
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+SMALL_SIZE = 8
+"""Size from which entries are stored in a trie rather than a tuple."""
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_MASK = (1 << 64) - 1
+
+# A trie entry is a `(hash, key, value, order)` tuple, `order` being its rank
+# in insertion order.
+_Entry = tuple[int, Any, Any, int]
+_order = itemgetter(3)
+
+
+class _Node:
+    """
+    Trie node: `bitmap` has a bit set for each of the 32 slots in use, `items`
+    holds their entries or child nodes, in slot order.
+    """
+
+    __slots__ = ("bitmap", "items")
+
+    def __init__(self, bitmap: int, items: tuple[Any, ...]) -> None:
+        self.bitmap = bitmap
+        self.items = items
+
+
+class _Collision:
+    """
+    Entries whose keys have the same hash.
+    """
+
+    __slots__ = ("hash", "entries")
+
+    def __init__(self, hash: int, entries: tuple[_Entry, ...]) -> None:
+        self.hash = hash
+        self.entries = entries
+
+
+def _pair(shift: int, first: _Entry, second: _Entry) -> _Node | _Collision:
+    if first[0] == second[0]:
+        return _Collision(first[0], (first, second))
+    first_slot = (first[0] >> shift) & _MASK
+    second_slot = (second[0] >> shift) & _MASK
+    if first_slot == second_slot:
+        return _Node(1 << first_slot, (_pair(shift + _BITS, first, second),))
+    items = (first, second) if first_slot < second_slot else (second, first)
+    return _Node((1 << first_slot) | (1 << second_slot), items)
+
+
+def _assoc(node: Any, shift: int, entry: _Entry) -> tuple[Any, bool]:
+    """
+    `node` with `entry` set, and whether the entry is a new key. The order of
+    an existing key is kept.
+    """
+    if isinstance(node, _Collision):
+        if node.hash != entry[0]:
+            slot = (node.hash >> shift) & _MASK
+            return _assoc(_Node(1 << slot, (node,)), shift, entry)
+        for index, existing in enumerate(node.entries):
+            if existing[1] == entry[1]:
+                replaced = (entry[0], entry[1], entry[2], existing[3])
+                entries = (*node.entries[:index], replaced, *node.entries[index + 1 :])
+                return _Collision(node.hash, entries), False
+        return _Collision(node.hash, (*node.entries, entry)), True
+
+    bit = 1 << ((entry[0] >> shift) & _MASK)
+    index = (node.bitmap & (bit - 1)).bit_count()
+    items = node.items
+    if not node.bitmap & bit:
+        return _Node(node.bitmap | bit, (*items[:index], entry, *items[index:])), True
+
+    item = items[index]
+    added = False
+    if type(item) is tuple:
+        if item[0] == entry[0] and item[1] == entry[1]:
+            child: Any = (entry[0], entry[1], entry[2], item[3])
+        else:
+            child = _pair(shift + _BITS, item, entry)
+            added = True
+    else:
+        child, added = _assoc(item, shift + _BITS, entry)
+    return _Node(node.bitmap, (*items[:index], child, *items[index + 1 :])), added
+
+
+def _find(node: Any, shift: int, hash: int, key: Any) -> _Entry | None:
+    while True:
+        if isinstance(node, _Collision):
+            for entry in node.entries:
+                if entry[1] == key:
+                    return entry
+            return None
+        bit = 1 << ((hash >> shift) & _MASK)
+        if not node.bitmap & bit:
+            return None
+        node = node.items[(node.bitmap & (bit - 1)).bit_count()]
+        if type(node) is tuple:
+            return node if node[0] == hash and node[1] == key else None
+        shift += _BITS
+
+
+def _entries(node: Any, entries: list[_Entry]) -> list[_Entry]:
+    if isinstance(node, _Collision):
+        entries.extend(node.entries)
+        return entries
+    for item in node.items:
+        if type(item) is tuple:
+            entries.append(item)
+        else:
+            _entries(item, entries)
+    return entries
+
+
+def _ordered(root: _Node) -> list[_Entry]:
+    entries = _entries(root, [])
+    entries.sort(key=_order)
+    return entries
+
+
+class PersistentMap(Mapping[K, V], Generic[K, V]):
+    """
+    An immutable mapping with cheap updates, see the module documentation.
+    """
+
+    __slots__ = ("_pairs", "_root", "_size", "_order")
+
+    def __init__(self, items: Iterable[tuple[K, V]] = ()) -> None:
+        self._pairs: tuple[tuple[K, V], ...] = ()
+        self._root: _Node | None = None
+        self._size = 0
+        self._order = 0
+        for key, value in items:
+            self._set(key, value)
+
+    @classmethod
+    def _copy(cls, other: "PersistentMap[K, V]") -> "PersistentMap[K, V]":
+        new = cls.__new__(cls)
+        new._pairs = other._pairs
+        new._root = other._root
+        new._size = other._size
+        new._order = other._order
+        return new
+
+    def _set(self, key: K, value: V) -> None:
+        # Only ever called on maps nobody else has seen yet.
+        if self._root is None:
+            pairs = self._pairs
+            for index, (existing, _) in enumerate(pairs):
+                if existing == key:
+                    self._pairs = (*pairs[:index], (key, value), *pairs[index + 1 :])
+                    return
+            if len(pairs) + 1 < SMALL_SIZE:
+                self._pairs = (*pairs, (key, value))
+                self._size += 1
+                return
+            # Moving to a trie, the tuple's positions become the order.
+            root = _Node(0, ())
+            for order, (existing, item) in enumerate((*pairs, (key, value))):
+                root, _ = _assoc(root, 0, (hash(existing) & _HASH_MASK, existing, item, order))
+            self._root = root
+            self._pairs = ()
+            self._size = self._order = len(pairs) + 1
+            return
+
+        entry = (hash(key) & _HASH_MASK, key, value, self._order)
+        self._root, added = _assoc(self._root, 0, entry)
+        if added:
+            self._size += 1
+            self._order += 1
+
+    def set(self, key: K, value: V) -> "PersistentMap[K, V]":
+        """
+        A map with `key` set to `value`, sharing the rest with this one.
+        """
+        new = self._copy(self)
+        new._set(key, value)
+        return new
+
+    def update(self, other: Mapping[K, V]) -> "PersistentMap[K, V]":
+        """
+        A map with the items of `other` set, in `other`'s order.
+        """
+        if not other:
+            return self
+        if not self and isinstance(other, PersistentMap):
+            return other
+        new = self._copy(self)
+        for key, value in other.items():
+            new._set(key, value)
+        return new
+
+    def __getitem__(self, key: K) -> V:
+        if self._root is None:
+            for existing, value in self._pairs:
+                if existing == key:
+                    return value
+            raise KeyError(key)
+        entry = _find(self._root, 0, hash(key) & _HASH_MASK, key)
+        if entry is None:
+            raise KeyError(key)
+        return entry[2]  # type: ignore[no-any-return]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[K]:
+        return (key for key, _ in self.items())
+
+    def items(self) -> Iterator[tuple[K, V]]:  # type: ignore[override]
+        if self._root is None:
+            return iter(self._pairs)
+        return iter([(entry[1], entry[2]) for entry in _ordered(self._root)])
+
+    def values(self) -> Iterator[V]:  # type: ignore[override]
+        if self._root is None:
+            return iter([value for _, value in self._pairs])
+        return iter([entry[2] for entry in _ordered(self._root)])
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({dict(self.items())!r})"
@@ -0,0 +1,126 @@
+"""
+Batch rendering across processes.
+
+`render_pages` spreads whole documents over a process pool by shipping only a
+page function and its arguments: workers build the trees themselves, so the
+parent does next to no work per document and throughput follows the number of
+cores.
+
+`render_batch` renders trees that already exist. They are not pickled as they
+are: parent back-pointers, listeners and style objects would make every
+document expensive to ship. Documents are sent in the binary format of
+`prymal.core.serialization` instead, which keeps what rendering needs and
+doesn't recurse however deep the tree is. Encoding a tree costs a fraction of
+rendering it, which the parent pays for every document: prefer `render_pages`
+when the documents can be built in the workers.
+"""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from os import cpu_count
+from typing import Any
+
+from ..element import Element
+from ..serialization import dumps, loads
+from .web_renderer import render_to_string
+
+
+def _render(data: bytes, options: dict[str, Any], encoding: str | None) -> str | bytes:
+    html = render_to_string(loads(data), **options)
+    return html if encoding is None else html.encode(encoding)
+
+
+def _build(
+    page: Callable[..., Element],
+    arguments: tuple[Any, ...],
+    options: dict[str, Any],
+    encoding: str | None,
+) -> str | bytes:
+    html = render_to_string(page(*arguments), **options)
+    return html if encoding is None else html.encode(encoding)
+
+
+def _in_flight(executor: Executor) -> int:
+    # Executors don't expose their size, the standard library ones keep it
+    # here.
+    workers = getattr(executor, "_max_workers", None) or cpu_count() or 1
+    return 4 * workers
+
+
+def _results(
+    executor: Executor, tasks: Iterable[tuple[Callable[..., str | bytes], tuple[Any, ...]]]
+) -> Iterator[str | bytes]:
+    """
+    Submits the tasks as their results are consumed, a bounded number of them
+    being in flight at once, and yields the results in order.
+    """
+    in_flight = _in_flight(executor)
+    pending: deque[Future[str | bytes]] = deque()
+    for function, arguments in tasks:
+        pending.append(executor.submit(function, *arguments))
+        if len(pending) >= in_flight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def render_pages(
+    page: Callable[..., Element],
+    arguments: Iterable[tuple[Any, ...]],
+    *,
+    executor: Executor | None = None,
+    encoding: str | None = None,
+    pretty: bool = False,
+    indent: int = 2,
+    atomic_styles: bool = False,
+) -> Iterator[str | bytes]:
+    """
+    Renders `page(*args)` for every `args` of `arguments` in a pool of worker
+    processes and yields their HTML in order, encoded when `encoding` is
+    given.
+
+    `page` and the arguments are pickled: `page` must be a module level
+    function or class, such as a component. Arguments are submitted as the
+    results are consumed, so an arbitrarily long batch never sits in memory.
+    Without an `executor` a `ProcessPoolExecutor` with one worker per core is
+    used for the duration of the batch.
+    """
+    options: dict[str, Any] = {"pretty": pretty, "indent": indent, "atomic_styles": atomic_styles}
+    if executor is None:
+        with ProcessPoolExecutor() as pool:
+            yield from render_pages(page, arguments, executor=pool, encoding=encoding, **options)
+        return
+
+    yield from _results(executor, ((_build, (page, args, options, encoding)) for args in arguments))
+
+
+def render_batch(
+    documents: Iterable[Element],
+    *,
+    executor: Executor | None = None,
+    encoding: str | None = None,
+    pretty: bool = False,
+    indent: int = 2,
+    atomic_styles: bool = False,
+) -> Iterator[str | bytes]:
+    """
+    Renders every document in a pool of worker processes and yields their
+    HTML in order, encoded when `encoding` is given.
+
+    Documents are serialized and submitted as the results are consumed, see
+    `render_pages`.
+
+    Server listeners aren't shipped, their elements render without them.
+    Classes and templates other than Prymal's own, components included, must
+    be given to `prymal.core.serialization.register` in a module the workers
+    import.
+    """
+    options: dict[str, Any] = {"pretty": pretty, "indent": indent, "atomic_styles": atomic_styles}
+    if executor is None:
+        with ProcessPoolExecutor() as pool:
+            yield from render_batch(documents, executor=pool, encoding=encoding, **options)
+        return
+
+    tasks = ((_render, (dumps(document), options, encoding)) for document in documents)
+    yield from _results(executor, tasks)
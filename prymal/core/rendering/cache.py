@@ -0,0 +1,80 @@
+"""
+Fragment cache for memoized subtrees.
+
+Elements opted in with `Element.memoize()` (or components with `memoized = True`)
+have their rendered HTML stored under their structural digest, so following
+renders splice the stored fragment in without walking the subtree again.
+Elements memoized with an explicit key, and components implementing
+`cache_key`, are stored under their class and that key: finding them costs no
+hashing, and such components aren't even built on a hit.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import NamedTuple
+
+from ..style import Style
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+class Fragment(NamedTuple):
+    """
+    Rendered HTML of a subtree along with the styles used inside it, which the
+    stylesheet still needs rules for when the fragment is spliced in.
+    """
+
+    html: str
+    styles: tuple[Style, ...]
+    size: int
+
+
+class FragmentCache:
+    """
+    Least recently used cache of rendered fragments, bounded by the total
+    UTF-8 size of the stored HTML.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._fragments: OrderedDict[Hashable, Fragment] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._fragments
+
+    def get(self, key: Hashable) -> Fragment | None:
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+            return fragment
+
+    def put(self, key: Hashable, html: str, styles: tuple[Style, ...]) -> None:
+        fragment = Fragment(html, styles, len(html.encode()))
+        if fragment.size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._fragments.pop(key, None)
+            if previous is not None:
+                self.size -= previous.size
+            self._fragments[key] = fragment
+            self.size += fragment.size
+            while self.size > self.max_bytes:
+                _, evicted = self._fragments.popitem(last=False)
+                self.size -= evicted.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fragments.clear()
+            self.size = 0
+
+
+fragment_cache = FragmentCache()
+"""Cache used by the renderer when none is given explicitly."""
@@ -0,0 +1,481 @@
+"""
+Virtual DOM diffing.
+
+`diff` compares two `Element` trees and returns the patches turning the markup
+of the first one into the markup of the second one, so updates can be pushed to
+the browser without re-sending the page. Patches are tuples of JSON types,
+`dumps` serializes them and `PATCH_SCRIPT` applies them client side.
+
+Elements are addressed by their path: the child indexes leading to them from
+the root, counting rendered tags only. Paths are valid at the time the patch is
+applied, patches must therefore be applied in order.
+
+Trees updated in place are diffed against a `snapshot` taken before the update.
+"""
+
+import json
+from bisect import bisect_left
+from collections import defaultdict, deque
+from collections.abc import Iterable, Mapping, Sequence
+from enum import IntEnum, auto
+from typing import Any, TypeAlias
+
+from ...component import build_all
+from ..element import _NO_CHILDREN, Element
+from ..traversal import preorder
+from .stylesheet import StyleSheet
+from .template import Prerendered
+from .web_renderer import (
+    _attribute_name,
+    _class_attribute,
+    _rendered_attributes,
+    render_to_string,
+)
+
+Path: TypeAlias = tuple[int, ...]
+Patch: TypeAlias = tuple[Any, ...]
+_Address: TypeAlias = "tuple[_Address, int] | None"
+"""A path as the address of the parent and an index, `None` for the root."""
+
+
+class PatchOp(IntEnum):
+    Insert = auto()
+    """`(Insert, parent_path, index, html)`"""
+    Remove = auto()
+    """`(Remove, path)`"""
+    Move = auto()
+    """`(Move, parent_path, from_index, to_index)`, `to_index` is counted once
+    the element has been taken out."""
+    Replace = auto()
+    """`(Replace, path, html)`"""
+    SetText = auto()
+    """`(SetText, path, text)`"""
+    SetAttribute = auto()
+    """`(SetAttribute, path, name, value)`, a `None` value removes it."""
+    ChangeClass = auto()
+    """`(ChangeClass, path, classes)`, `None` removes the class attribute."""
+    AddStyles = auto()
+    """`(AddStyles, css)`, rules used by the new tree the old one didn't have."""
+
+
+def _dom_root(element: Element) -> Element:
+    while element.tag_name is None and len(element._children) == 1:
+        element = element._children[0]
+    return element
+
+
+def _dom_children(element: Element) -> list[Element] | None:
+    """
+    The children of an element as they end up in the markup, elements without
+    a tag of their own (components) are replaced by their children. `None`
+    when a prerendered template is among them, its markup can't be addressed
+    node by node.
+    """
+    children: list[Element] = []
+    stack = list(reversed(element._children))
+    while stack:
+        child = stack.pop()
+        if child.tag_name is None:
+            if isinstance(child, Prerendered):
+                return None
+            stack.extend(reversed(child._children))
+        else:
+            children.append(child)
+    return children
+
+
+def _attribute_value(value: Any) -> str | None:
+    if value is None or value is False:
+        return None
+    return "" if value is True else str(value)
+
+
+def _path(address: _Address) -> Path:
+    """
+    Spells out an address. Addresses share their parent's, so walking a deep
+    tree doesn't copy the path at every level: only patches carry one.
+    """
+    indexes: list[int] = []
+    while address is not None:
+        address, index = address
+        indexes.append(index)
+    indexes.reverse()
+    return tuple(indexes)
+
+
+def _diff_attributes(old: Mapping[str, Any], new: Mapping[str, Any]) -> list[tuple[str, Any]]:
+    changes: list[tuple[str, Any]] = []
+    for name in {**old, **new}:
+        if name == "class_":
+            continue
+        value = _attribute_value(new.get(name))
+        if _attribute_value(old.get(name)) != value:
+            changes.append((_attribute_name(name), value))
+    return changes
+
+
+def _match(old: Sequence[Element], new: Sequence[Element]) -> list[int | None]:
+    """
+    For every new child, the index of the old child it updates. Children are
+    matched by key, then by identity and finally, for children without a key,
+    in order among the remaining children with the same tag.
+    """
+    keyed: dict[Any, int] = {}
+    retained: dict[Element, int] = {}
+    for index, child in enumerate(old):
+        if child.key is not None:
+            keyed[child.key] = index
+        else:
+            retained[child] = index
+
+    matches: list[int | None] = [None] * len(new)
+    used: set[int] = set()
+    for position, child in enumerate(new):
+        found = keyed.get(child.key) if child.key is not None else retained.get(child)
+        if found is not None and found not in used and old[found].tag_name == child.tag_name:
+            matches[position] = found
+            used.add(found)
+
+    unused: defaultdict[str | None, deque[int]] = defaultdict(deque)
+    for index, child in enumerate(old):
+        if index not in used and child.key is None:
+            unused[child.tag_name].append(index)
+    for position, child in enumerate(new):
+        if matches[position] is None and child.key is None and unused[child.tag_name]:
+            matches[position] = unused[child.tag_name].popleft()
+
+    return matches
+
+
+def _longest_increasing(sequence: Sequence[int]) -> set[int]:
+    """
+    Values of a longest strictly increasing subsequence, these children keep
+    their place while every other one is moved around them.
+    """
+    tails: list[int] = []
+    tail_positions: list[int] = []
+    previous = [-1] * len(sequence)
+    for position, value in enumerate(sequence):
+        length = bisect_left(tails, value)
+        if length:
+            previous[position] = tail_positions[length - 1]
+        if length == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[length] = value
+            tail_positions[length] = position
+
+    stable: set[int] = set()
+    position = tail_positions[-1] if tail_positions else -1
+    while position != -1:
+        stable.add(sequence[position])
+        position = previous[position]
+    return stable
+
+
+def _slots(
+    size: int, matches: Sequence[int | None], stable: set[int]
+) -> tuple[dict[int, int], list[int]]:
+    """
+    Orders the places a child can occupy while the children are being moved,
+    so its index is the number of occupied places before its own. Children
+    that move have one place at their old index and one right before their
+    successor, once moved: the moved children ending up before a stable child
+    come after the children still waiting to move out from before it.
+
+    Returns the place of every matched old child and of every new child.
+    """
+    # The new children moving before each stable child, `None` for the end.
+    arriving: defaultdict[int | None, list[int]] = defaultdict(list)
+    anchor: int | None = None
+    stable_positions: dict[int, int] = {}
+    for position in range(len(matches) - 1, -1, -1):
+        index = matches[position]
+        if index is not None and index in stable:
+            anchor = index
+            stable_positions[index] = position
+        else:
+            arriving[anchor].append(position)
+
+    old_slots: dict[int, int] = {}
+    new_slots = [0] * len(matches)
+    matched = set(matches)
+    slot = 0
+    for index in (*range(size), None):
+        if index is not None and index not in stable:
+            if index in matched:
+                old_slots[index] = slot
+                slot += 1
+            continue
+        for position in reversed(arriving[index]):
+            new_slots[position] = slot
+            slot += 1
+        if index is not None:
+            old_slots[index] = new_slots[stable_positions[index]] = slot
+            slot += 1
+    return old_slots, new_slots
+
+
+class _Positions:
+    """
+    Counts the occupied places before a place in logarithmic time, as a
+    Fenwick tree.
+    """
+
+    __slots__ = ("counts",)
+
+    def __init__(self, size: int, occupied: Iterable[int]) -> None:
+        counts = [0] * size
+        for slot in occupied:
+            counts[slot] = 1
+        for slot in range(size):
+            parent = slot | (slot + 1)
+            if parent < size:
+                counts[parent] += counts[slot]
+        self.counts = counts
+
+    def add(self, slot: int, delta: int) -> None:
+        counts = self.counts
+        while slot < len(counts):
+            counts[slot] += delta
+            slot |= slot + 1
+
+    def before(self, slot: int) -> int:
+        counts = self.counts
+        total = 0
+        slot -= 1
+        while slot >= 0:
+            total += counts[slot]
+            slot = (slot & (slot + 1)) - 1
+        return total
+
+
+class _Differ:
+    __slots__ = ("old_stylesheet", "new_stylesheet", "patches")
+
+    def __init__(self, old: Element, atomic_styles: bool) -> None:
+        self.old_stylesheet = StyleSheet(atomic_styles).collect(old)
+        self.new_stylesheet = StyleSheet(atomic_styles)
+        self.patches: list[Patch] = []
+
+    def html(self, element: Element) -> str:
+        return render_to_string(element, stylesheet=self.new_stylesheet)
+
+    def diff(self, old_root: Element, new_root: Element) -> list[Patch]:
+        patches = self.patches
+        stack: list[tuple[Element, Element, _Address]] = [
+            (_dom_root(old_root), _dom_root(new_root), None)
+        ]
+        while stack:
+            old, new, address = stack.pop()
+            if old.digest == new.digest:
+                continue
+            if old.tag_name != new.tag_name or new.tag_name is None:
+                patches.append((PatchOp.Replace, _path(address), self.html(new)))
+                continue
+
+            text = old.text != new.text
+            attributes = _diff_attributes(_rendered_attributes(old), _rendered_attributes(new))
+            classes = _class_attribute(new, self.new_stylesheet)
+            reclassed = _class_attribute(old, self.old_stylesheet) != classes
+            if text or attributes or reclassed:
+                path = _path(address)
+                if text:
+                    patches.append((PatchOp.SetText, path, " ".join(new.text)))
+                for name, value in attributes:
+                    patches.append((PatchOp.SetAttribute, path, name, value))
+                if reclassed:
+                    patches.append((PatchOp.ChangeClass, path, classes))
+
+            stack.extend(self.diff_children(old, new, address))
+
+        css = self.new_stylesheet.css(known=self.old_stylesheet)
+        if css:
+            patches.append((PatchOp.AddStyles, css))
+        return patches
+
+    def diff_children(
+        self, old_parent: Element, new_parent: Element, address: _Address
+    ) -> list[tuple[Element, Element, _Address]]:
+        old = _dom_children(old_parent)
+        new = _dom_children(new_parent)
+        if old is None or new is None:
+            self.patches.append((PatchOp.Replace, _path(address), self.html(new_parent)))
+            return []
+        matches = _match(old, new)
+
+        matched = {index for index in matches if index is not None}
+        stable = _longest_increasing([index for index in matches if index is not None])
+        if len(stable) == len(matched) == len(old) == len(new):
+            return [(old[index], new[index], (address, index)) for index in range(len(new))]
+
+        path = _path(address)
+        for removed in range(len(old) - 1, -1, -1):
+            if removed not in matched:
+                self.patches.append((PatchOp.Remove, (*path, removed)))
+
+        # Walk the new children from the back, moving or inserting each one
+        # that isn't stable right before its successor.
+        old_slots, new_slots = _slots(len(old), matches, stable)
+        positions = _Positions(len(old) + len(new), old_slots.values())
+
+        for position in range(len(new) - 1, -1, -1):
+            index = matches[position]
+            if index is not None and index in stable:
+                continue
+            slot = new_slots[position]
+            if index is None:
+                to = positions.before(slot)
+                self.patches.append((PatchOp.Insert, path, to, self.html(new[position])))
+            else:
+                origin = positions.before(old_slots[index])
+                positions.add(old_slots[index], -1)
+                to = positions.before(slot)
+                self.patches.append((PatchOp.Move, path, origin, to))
+            positions.add(slot, 1)
+
+        return [
+            (old[index], new[position], (address, position))
+            for position, index in enumerate(matches)
+            if index is not None
+        ]
+
+
+class _Snapshot(Element):
+    """
+    A frozen copy of an element, see `snapshot`.
+    """
+
+    __slots__ = ("tag_name", "self_closing", "attributes", "text")
+
+
+def _copy(element: Element) -> Element:
+    if element.__class__ is Prerendered:
+        # Templates are immutable, the element itself can be shared.
+        return element
+    copy = _Snapshot()
+    copy.tag_name = element.tag_name  # type: ignore[misc]
+    copy.self_closing = element.self_closing  # type: ignore[misc]
+    # Shared, elements replace their mappings rather than updating them.
+    copy.attributes = _rendered_attributes(element)  # type: ignore[misc]
+    copy.text = element.text  # type: ignore[misc]
+    copy.style = element.style
+    copy.key = element.key
+    copy._digest = element._digest
+    copy._children = [] if element._children else _NO_CHILDREN
+    return copy
+
+
+def snapshot(root: Element, previous: Element | None = None) -> Element:
+    """
+    Copy of the rendered state of a tree, to diff the tree against once it has
+    been updated in place. Digests are copied along, so subtrees left untouched
+    by the update are skipped by `diff` without being compared. Updates must go
+    through the element's methods, which reset the digests they affect.
+
+    `previous`, an earlier snapshot of the same tree, lends its copies of the
+    subtrees that haven't changed since: snapshots are never modified, so they
+    can share them, and only the updated parts of the tree are copied again.
+    """
+    build_all(root).digest  # Computes every missing digest of the tree.
+    if previous is not None and previous._digest == root._digest and previous.key == root.key:
+        return previous
+
+    top = _copy(root)
+    stack: list[tuple[Element, Element, Element | None]] = [(root, top, previous)]
+    while stack:
+        element, copy, before = stack.pop()
+        if copy is element or not element._children:
+            continue
+        earlier: Sequence[Element] = ()
+        unchanged: defaultdict[bytes | None, list[Element]] = defaultdict(list)
+        if before is not None and before.__class__ is _Snapshot:
+            earlier = before._children
+            for child in reversed(earlier):
+                unchanged[child._digest].append(child)
+
+        children = copy._children
+        for position, child in enumerate(element._children):
+            candidates = unchanged.get(child._digest)
+            if candidates and candidates[-1].key == child.key:
+                children.append(candidates.pop())  # type: ignore[union-attr]
+                continue
+            child_copy = _copy(child)
+            children.append(child_copy)  # type: ignore[union-attr]
+            if child_copy is not child:
+                pair = earlier[position] if position < len(earlier) else None
+                stack.append((child, child_copy, pair))
+    return top
+
+
+def diff(old: Element, new: Element, *, atomic_styles: bool = False) -> list[Patch]:
+    """
+    The patches turning the rendered `old` tree into the rendered `new` tree.
+    Unchanged subtrees are skipped by comparing their digests. Components of
+    `new` waiting for a cache miss are built, see `unbuilt`.
+    """
+    return _Differ(old, atomic_styles).diff(old, build_all(new))
+
+
+def dumps(patches: list[Patch]) -> str:
+    """
+    Serializes patches to compact JSON for `PATCH_SCRIPT`.
+    """
+    return json.dumps(patches, separators=(",", ":"))
+
+
+PATCH_SCRIPT = """
+window.prymalPatch = function (mount, patches) {
+  const at = (path) => path.reduce((node, i) => node.children[i], mount.firstElementChild);
+  const parse = (html) => {
+    const template = document.createElement("template");
+    template.innerHTML = html;
+    return template.content.firstElementChild;
+  };
+  for (const [op, ...args] of patches) {
+    switch (op) {
+      case 1: {
+        const parent = at(args[0]);
+        parent.insertBefore(parse(args[2]), parent.children[args[1]] || null);
+        break;
+      }
+      case 2:
+        at(args[0]).remove();
+        break;
+      case 3: {
+        const parent = at(args[0]);
+        const node = parent.children[args[1]];
+        node.remove();
+        parent.insertBefore(node, parent.children[args[2]] || null);
+        break;
+      }
+      case 4:
+        at(args[0]).replaceWith(parse(args[1]));
+        break;
+      case 5: {
+        const node = at(args[0]);
+        const first = node.firstChild;
+        if (first && first.nodeType === Node.TEXT_NODE) first.data = args[1];
+        else node.insertBefore(document.createTextNode(args[1]), first);
+        break;
+      }
+      case 6:
+        if (args[2] === null) at(args[0]).removeAttribute(args[1]);
+        else at(args[0]).setAttribute(args[1], args[2]);
+        break;
+      case 7:
+        if (args[1] === null) at(args[0]).removeAttribute("class");
+        else at(args[0]).setAttribute("class", args[1]);
+        break;
+      case 8: {
+        const style = document.createElement("style");
+        style.textContent = args[0];
+        document.head.appendChild(style);
+        break;
+      }
+    }
+  }
+};
+"""
+"""Defines `prymalPatch(mount, patches)`, `mount` is the element the root was rendered in."""
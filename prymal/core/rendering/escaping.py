@@ -0,0 +1,68 @@
+"""
+HTML escaping tuned for the renderer.
+
+Most text and attribute values of a page contain nothing to escape. `escape`
+only replaces the characters a string actually contains, so such strings are
+returned untouched, without allocating. `&` is replaced first so the entities
+introduced afterwards aren't escaped again. The output is the same as
+`html.escape`'s.
+
+`Markup` marks strings that are already safe HTML, such as rendered fragments.
+Escaping them is a no-op, so they are never escaped twice, and so is escaping
+any object implementing `__html__`.
+"""
+
+from typing import Any
+
+
+class Markup(str):
+    """
+    A string of HTML rendered as is.
+
+    ```py
+    Text(Markup("<b>bold</b>"))
+    ```
+    """
+
+    __slots__ = ()
+
+    def __html__(self) -> str:
+        return self
+
+    def __repr__(self) -> str:
+        # Tells markup apart from equal text in element digests.
+        return f"Markup({super().__repr__()})"
+
+    @classmethod
+    def escape(cls, value: Any) -> "Markup":
+        """
+        `value` escaped and marked safe.
+        """
+        return cls(escape(value))
+
+
+def escape(value: Any, quote: bool = True) -> str:
+    """
+    `value` as text safe to put in HTML, quotes being escaped as well when
+    `quote` is set, as `html.escape` does. Non-string values are converted
+    with `str`.
+    """
+    if value.__class__ is not str:
+        html = getattr(value, "__html__", None)
+        if html is not None:
+            return html()
+        value = str(value)
+    # Membership tests are much cheaper than replacing, and strings without
+    # any of these characters come out as they went in.
+    if "&" in value:
+        value = value.replace("&", "&amp;")
+    if "<" in value:
+        value = value.replace("<", "&lt;")
+    if ">" in value:
+        value = value.replace(">", "&gt;")
+    if quote:
+        if '"' in value:
+            value = value.replace('"', "&quot;")
+        if "'" in value:
+            value = value.replace("'", "&#x27;")
+    return value
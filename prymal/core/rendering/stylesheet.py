@@ -0,0 +1,163 @@
+"""
+Stylesheet compilation.
+
+Every `Style` reachable from a rendered tree is normalized (the last value of a
+property wins) and styles with the same effective declarations share a single
+generated class, so a page only ships one rule per distinct look instead of one
+per element.
+"""
+
+import re
+from hashlib import blake2s
+from typing import Self
+
+from ..element import Element
+from ..style import Style, StyleKey
+from ..traversal import Prune, preorder
+
+
+_NAME = re.compile(r"-?-?[A-Za-z_][A-Za-z0-9_-]*")
+_PLAIN = re.compile(r"""[^{};()\\"'\n]*""")
+"""Values without anything to scan, most of them."""
+
+
+def _class_name(prefix: str, css: str) -> str:
+    return f"{prefix}{blake2s(css.encode(), digest_size=8).hexdigest()}"
+
+
+def _contained(value: str) -> bool:
+    """
+    Whether a value ends with its declaration: `;`, `{` and `}` only appear
+    in strings and `url()`, which are all closed.
+    """
+    if _PLAIN.fullmatch(value):
+        return True
+    quote: str | None = None
+    url = False
+    position = 0
+    length = len(value)
+    while position < length:
+        char = value[position]
+        if char == "\\":
+            # A trailing backslash would escape the end of the rule.
+            if position + 1 == length:
+                return False
+            position += 2
+            continue
+        if quote is not None:
+            if char == quote:
+                quote = None
+            elif char == "\n":
+                return False
+        elif char == '"' or char == "'":
+            quote = char
+        elif url:
+            url = char != ")"
+        elif char in "{};":
+            return False
+        elif char == "(" and value[max(position - 3, 0) : position].lower() == "url":
+            url = True
+        position += 1
+    return quote is None and not url
+
+
+def _declaration(name: str, value: str) -> str:
+    if not _NAME.fullmatch(name) or not _contained(value):
+        raise ValueError(f"Invalid CSS declaration {name}: {value!r}")
+    # `<` is escaped so a value can't close the `<style>` block.
+    return f"{name}:{value}".replace("<", "\\3c ")
+
+
+def _overrides(declarations: StyleKey) -> bool:
+    """
+    Whether a shorthand and one of its longhands are both declared, whose
+    order only holds within a single rule.
+    """
+    names = [name for name, _ in declarations]
+    return any(other.startswith(f"{name}-") for name in names for other in names)
+
+
+class StyleSheet:
+    """
+    Maps the styles of a tree onto generated class names and renders the
+    matching `<style>` block.
+
+    Class names are derived from the declarations themselves, so the same style
+    gets the same class across renders. Declarations that would end their rule,
+    such as values with `;`, `{` or `}` outside of a string or `url()`, raise a
+    `ValueError`, `<` is escaped. With `atomic=True` every declaration
+    becomes its own single-property class and elements list one class per
+    property instead, except for styles declaring both a shorthand and one of
+    its longhands, which keep a single rule.
+    """
+
+    def __init__(self, atomic: bool = False) -> None:
+        self.atomic = atomic
+        self.head: Element | None = None
+        self._classes: dict[Style, str | None] = {}
+        self._rules: dict[str, str] = {}
+
+    def collect(self, root: Element, prune: Prune | None = None) -> Self:
+        """
+        Registers the style of every element of the tree.
+        """
+        for element in preorder(root, prune):
+            self.class_for(element.style)
+            if self.head is None and element.tag_name == "head":
+                self.head = element
+        return self
+
+    def class_for(self, style: Style) -> str | None:
+        """
+        The value of the class attribute for elements with the given style, or
+        `None` when the style has no declarations.
+        """
+        style = style.intern()
+        try:
+            return self._classes[style]
+        except KeyError:
+            pass
+
+        declarations = style.key
+        if not declarations:
+            class_names = None
+        elif self.atomic and not _overrides(declarations):
+            class_names = " ".join(self._intern("a", (item,)) for item in declarations)
+        else:
+            class_names = self._intern("p", declarations)
+
+        self._classes[style] = class_names
+        return class_names
+
+    def _intern(self, prefix: str, declarations: StyleKey) -> str:
+        body = ";".join([_declaration(name, value) for name, value in declarations])
+        name = _class_name(prefix, body)
+        if self._rules.setdefault(name, body) != body:
+            raise RuntimeError(f"Class name collision between {body!r} and {self._rules[name]!r}")
+        return name
+
+    def update(self, other: "StyleSheet") -> None:
+        """
+        Adds the rules of another stylesheet, e.g. once they have been sent.
+        """
+        self._rules.update(other._rules)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def css(self, known: "StyleSheet | None" = None) -> str:
+        """
+        The rules of the stylesheet, leaving out those already in `known`.
+        """
+        return "".join(
+            f".{name}{{{body}}}"
+            for name, body in self._rules.items()
+            if known is None or name not in known._rules
+        )
+
+    def render(self) -> str:
+        """
+        The `<style>` block for the collected styles, empty when no element
+        has any style.
+        """
+        return f"<style>{self.css()}</style>" if self._rules else ""
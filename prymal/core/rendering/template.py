@@ -0,0 +1,182 @@
+"""
+Precompiled templates.
+
+A function building the same tree on every call, with only a few values
+changing, can be decorated with `compiled`. The function is traced once with
+placeholder arguments and its output is split into the static markup between
+the places the arguments ended up in. Calling the template then only fills
+those slots, no tree is built or walked.
+
+```py
+@compiled
+def card(title: str, href: str) -> Element:
+    return div(class_="card")(a(href=href)(Text(title)))
+```
+
+Arguments fill text and attribute values and are rendered as escaped
+`str(value)`, `Markup` as is. An argument making up a whole attribute value
+follows the rules of attributes instead: `None` and `False` leave the attribute
+out, `True` renders it without a value.
+
+Arguments must be placed in the tree as they are: branching on them or
+transforming them bakes whatever the placeholder produced into the template,
+using them in a style raises a `TypeError` when the template is compiled.
+"""
+
+import re
+from collections.abc import Callable
+from hashlib import blake2b
+from inspect import BoundArguments, Parameter, signature
+from typing import Any, Generic, NamedTuple, ParamSpec
+
+from ..element import Element
+from ..style import Style
+from .cache import Fragment
+from .escaping import escape
+from .stylesheet import StyleSheet
+
+P = ParamSpec("P")
+
+_MARKER = "\x00"
+_SLOT = re.compile(f"{_MARKER}(\\d+){_MARKER}")
+_ATTRIBUTE = re.compile(r' ([^\s"=<>]+)="$')
+"""The end of the markup before a slot filling a whole attribute value."""
+
+
+class Slot(str):
+    """
+    Stands in for an argument while a template is traced.
+    """
+
+    __slots__ = ()
+
+
+class _Plan(NamedTuple):
+    statics: tuple[str, ...]
+    """Markup around the slots, one more than there are slots."""
+    slots: tuple[int, ...]
+    """Index of the argument filling each slot."""
+    attributes: tuple[str | None, ...]
+    """For each slot filling a whole attribute value, ` name` of the attribute."""
+    styles: tuple[Style, ...]
+
+
+class Template(Generic[P]):
+    """
+    A compiled function, calling it returns a `Prerendered` element.
+    """
+
+    def __init__(self, function: Callable[P, Element]) -> None:
+        self.function = function
+        self.signature = signature(function)
+        self.__module__ = function.__module__
+        self.__name__ = function.__name__
+        self.__qualname__ = function.__qualname__
+        self.__doc__ = function.__doc__
+        self._plans: dict[bool, _Plan] = {}
+
+        for parameter in self.signature.parameters.values():
+            if parameter.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+                raise TypeError(f"{self.__qualname__}: variadic arguments can't be compiled")
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> "Prerendered":
+        arguments = self.signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        return Prerendered(self, tuple(arguments.arguments.values()))
+
+    def __reduce__(self) -> str:
+        # Pickled by reference, like the function it replaces.
+        return self.__qualname__
+
+    def plan(self, atomic_styles: bool = False) -> _Plan:
+        """
+        The render plan, compiled on first use for each style mode since class
+        names are part of the static markup.
+        """
+        try:
+            return self._plans[atomic_styles]
+        except KeyError:
+            plan = self._plans[atomic_styles] = self._compile(atomic_styles)
+            return plan
+
+    def _compile(self, atomic_styles: bool) -> _Plan:
+        from .web_renderer import _styles, render_to_string
+
+        slots = {
+            name: Slot(f"{_MARKER}{index}{_MARKER}")
+            for index, name in enumerate(self.signature.parameters)
+        }
+        arguments = BoundArguments(self.signature, slots)  # type: ignore[arg-type]
+        root = self.function(*arguments.args, **arguments.kwargs)
+
+        stylesheet = StyleSheet(atomic_styles)
+        html = render_to_string(root, cache=None, stylesheet=stylesheet)
+        if _MARKER in stylesheet.css():
+            raise TypeError(f"{self.__qualname__}: arguments can't be used in styles")
+
+        parts = _SLOT.split(html)
+        statics = parts[0::2]
+        if any(_MARKER in static for static in statics):
+            raise TypeError(f"{self.__qualname__}: arguments must be placed in the tree as is")
+
+        # Attributes filled by a slot are taken out of the static markup, the
+        # slot renders them depending on the value.
+        attributes: list[str | None] = []
+        for position in range(len(statics) - 1):
+            match = _ATTRIBUTE.search(statics[position])
+            if match is None or not statics[position + 1].startswith('"'):
+                attributes.append(None)
+                continue
+            attributes.append(f" {match[1]}")
+            statics[position] = statics[position][: match.start()]
+            statics[position + 1] = statics[position + 1][1:]
+        return _Plan(tuple(statics), tuple(map(int, parts[1::2])), tuple(attributes), _styles(root))
+
+    def fill(self, values: tuple[Any, ...], atomic_styles: bool = False) -> Fragment:
+        """
+        The markup of the template for the given argument values.
+        """
+        statics, slots, attributes, styles = self.plan(atomic_styles)
+        parts = [statics[0]]
+        for index, attribute, static in zip(slots, attributes, statics[1:]):
+            value = values[index]
+            if attribute is None:
+                parts.append(escape(value))
+            elif value is True:
+                parts.append(attribute)
+            elif value is not None and value is not False:
+                parts.append(f'{attribute}="{escape(value)}"')
+            parts.append(static)
+        html = "".join(parts)
+        return Fragment(html, styles, len(html) if html.isascii() else len(html.encode()))
+
+
+class Prerendered(Element):
+    """
+    A compiled template along with its arguments. The renderer splices the
+    filled template into the output, the element itself has no children.
+    """
+
+    __slots__ = ("template", "values")
+
+    tag_name = None  # type: ignore[assignment]
+
+    def __init__(self, template: Template[Any], values: tuple[Any, ...]) -> None:
+        super().__init__()
+        self.template = template
+        self.values = values
+
+    def fragment(self, atomic_styles: bool = False) -> Fragment:
+        return self.template.fill(self.values, atomic_styles)
+
+    def _compute_digest(self) -> bytes:
+        template = self.template
+        identity = (template.__module__, template.__qualname__, self.values)
+        return blake2b(repr(identity).encode(), digest_size=16).digest()
+
+
+def compiled(function: Callable[P, Element]) -> Template[P]:
+    """
+    Compiles a function returning an element tree into a `Template`.
+    """
+    return Template(function)
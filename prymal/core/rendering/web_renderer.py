@@ -1,2 +1,409 @@
-from ..element import Element
+"""
+Web renderer, serializes an `Element` tree into HTML.
+
+`render` is a generator that yields the document in chunks so a large page can
+start going out over the wire before the whole tree has been serialized.
+`render_to_string` builds the same output with a single join and is the better
+fit for small fragments. `render_async` first awaits the data of the components
+implementing `load`, and streams deferred components out of order.
+"""
+
+import asyncio
+import logging
+import sys
+from collections.abc import AsyncIterator, Hashable, Iterator, Mapping
+from itertools import count
+from typing import Any, overload
+
+from ...component import Component, pending, resolve, resolve_deferred, unbuilt
+from ..element import Element, HTMLElement
 from ..style import Style
+from ..traversal import Visit, preorder, walk
+from .cache import Fragment, FragmentCache, fragment_cache
+from .escaping import escape
+from .stylesheet import StyleSheet
+from .template import Prerendered
+
+DEFAULT_CHUNK_SIZE = 8192
+"""Minimum amount of characters buffered before `render` yields a chunk."""
+
+logger = logging.getLogger("prymal.rendering")
+
+
+def _attribute_name(name: str) -> str:
+    return name.strip("_").replace("_", "-")
+
+
+def _format_attributes(attributes: Mapping[str, Any]) -> str:
+    parts: list[str] = []
+    for name, value in attributes.items():
+        if value is None or value is False:
+            continue
+        if value is True:
+            parts.append(f" {_attribute_name(name)}")
+        else:
+            parts.append(f' {_attribute_name(name)}="{escape(value)}"')
+    return "".join(parts)
+
+
+def _class_attribute(element: Element, stylesheet: StyleSheet) -> str | None:
+    class_names = stylesheet.class_for(element.style)
+    own_classes = element.attributes.get("class_")
+    if own_classes and class_names:
+        return f"{own_classes} {class_names}"
+    return own_classes or class_names
+
+
+def _rendered_attributes(element: Element) -> Mapping[str, Any]:
+    """
+    The attributes of an element along with those of its event listeners.
+    """
+    if element._event_listeners:
+        return {**element.attributes, **element._event_listeners.attributes()}
+    return element.attributes
+
+
+def _open_tag(element: Element, stylesheet: StyleSheet) -> str:
+    start = element._tag_start
+    if start is None:
+        if element.tag_name is None:
+            return ""
+        start = f"<{element.tag_name}"
+
+    attributes = _rendered_attributes(element)
+    class_names = stylesheet.class_for(element.style)
+    if class_names:
+        attributes = {**attributes, "class_": _class_attribute(element, stylesheet)}
+
+    tag = f"{start}{_format_attributes(attributes)}>" if attributes else f"{start}>"
+    text = element.text
+    if text:
+        if len(text) == 1:
+            tag += escape(text[0], quote=False)
+        else:
+            tag += " ".join([escape(part, quote=False) for part in text])
+    return tag
+
+
+def _close_tag(element: Element) -> str:
+    end = element._tag_end
+    if end is not None:
+        return end
+    if element.self_closing or element.tag_name is None:
+        return ""
+    return f"</{element.tag_name}>"
+
+
+def _pad(pretty: bool, indent: int, depth: int) -> str:
+    return f"\n{' ' * (indent * depth)}" if pretty else ""
+
+
+class _ChunkBuffer:
+    __slots__ = ("parts", "size")
+
+    def __init__(self) -> None:
+        self.parts: list[str] = []
+        self.size = 0
+
+    def write(self, fragment: str) -> None:
+        self.parts.append(fragment)
+        self.size += len(fragment)
+
+    def flush(self) -> str:
+        chunk = "".join(self.parts)
+        self.parts.clear()
+        self.size = 0
+        return chunk
+
+
+def _styles(element: Element) -> tuple[Style, ...]:
+    return tuple({descendant.style.intern() for descendant in preorder(element)})
+
+
+def _contains(element: Element, descendant: Element | None) -> bool:
+    while descendant is not None:
+        if descendant is element:
+            return True
+        if descendant.parent is descendant:
+            return False
+        descendant = descendant.parent
+    return False
+
+
+def _cache_key(element: Element, atomic_styles: bool) -> Hashable:
+    memoize = element._memoize
+    if memoize is True:
+        return (element.digest, atomic_styles)
+    return (memoize, atomic_styles)
+
+
+def _cacheable(element: Element, stylesheet: StyleSheet) -> bool:
+    if _contains(element, stylesheet.head):
+        return False
+    if element._memoize is True:
+        # Listener IDs are part of the digest, such fragments never match
+        # another tree.
+        return True
+    # Fragments found by key are spliced into other trees, the registry IDs
+    # of server listeners would point to elements of this one.
+    return not any(
+        descendant._event_listeners is not None and descendant._event_listeners.id is not None
+        for descendant in preorder(element)
+    )
+
+
+def _stream(
+    root: Element,
+    chunk_size: int,
+    pretty: bool,
+    indent: int,
+    stylesheet: StyleSheet,
+    emit_styles: bool,
+    cache: FragmentCache | None,
+) -> Iterator[str]:
+    atomic_styles = stylesheet.atomic
+    # Cached fragments are stored without indentation, pretty output always
+    # renders the full tree.
+    if pretty:
+        cache = None
+
+    def fragment_for(element: Element) -> Fragment | None:
+        if element.__class__ is Prerendered:
+            return element.fragment(atomic_styles)  # type: ignore[attr-defined]
+        if cache is None or not element._memoize:
+            return None
+        return cache.get(_cache_key(element, atomic_styles))
+
+    # The fragment found for each memoized element while collecting styles.
+    # The walk splices these very fragments: looking them up again could miss
+    # an entry evicted meanwhile, after its subtree was skipped.
+    fragments: dict[Element, Fragment] = {}
+
+    def spliced_styles(element: Element) -> bool:
+        if not element._memoize and element.__class__ is not Prerendered:
+            return False
+        fragment = fragment_for(element)
+        if fragment is None:
+            if unbuilt(element):
+                element.build()  # type: ignore[attr-defined]
+            return False
+        fragments[element] = fragment
+        for style in fragment.styles:
+            stylesheet.class_for(style)
+        return True
+
+    stylesheet.collect(root, spliced_styles)
+
+    out = _ChunkBuffer()
+    depth = 0
+    # Memoized elements being rendered for the first time, with the index of
+    # their first fragment in the buffer. The buffer isn't flushed meanwhile.
+    captures: list[tuple[Element, int]] = []
+    spliced: Element | None = None
+
+    for visit, element in walk(root, lambda element: element is spliced):
+        if visit is Visit.Enter:
+            if depth:
+                out.write(_pad(pretty, indent, depth))
+            depth += 1
+            if element._memoize or element.__class__ is Prerendered:
+                fragment = fragments.get(element)
+                if fragment is not None:
+                    out.write(fragment.html)
+                    spliced = element
+                    continue
+                if cache is not None:
+                    captures.append((element, len(out.parts)))
+            out.write(_open_tag(element, stylesheet))
+            continue
+
+        depth -= 1
+        if element is spliced:
+            spliced = None
+        else:
+            if emit_styles and element is stylesheet.head:
+                out.write(stylesheet.render())
+            if element._children:
+                out.write(_pad(pretty, indent, depth))
+            out.write(_close_tag(element))
+
+            if captures and captures[-1][0] is element:
+                _, start = captures.pop()
+                if cache is not None and _cacheable(element, stylesheet):
+                    html = "".join(out.parts[start:])
+                    cache.put(_cache_key(element, atomic_styles), html, _styles(element))
+
+        if out.size >= chunk_size and not captures:
+            yield out.flush()
+
+    if emit_styles and stylesheet.head is None:
+        out.write(stylesheet.render())
+    if out.size:
+        yield out.flush()
+
+
+@overload
+def render(
+    element: Element,
+    *,
+    encoding: None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    pretty: bool = False,
+    indent: int = 2,
+    atomic_styles: bool = False,
+    cache: FragmentCache | None = fragment_cache,
+) -> Iterator[str]: ...
+
+
+@overload
+def render(
+    element: Element,
+    *,
+    encoding: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    pretty: bool = False,
+    indent: int = 2,
+    atomic_styles: bool = False,
+    cache: FragmentCache | None = fragment_cache,
+) -> Iterator[bytes]: ...
+
+
+def render(
+    element: Element,
+    *,
+    encoding: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    pretty: bool = False,
+    indent: int = 2,
+    atomic_styles: bool = False,
+    cache: FragmentCache | None = fragment_cache,
+) -> Iterator[str] | Iterator[bytes]:
+    """
+    Renders `element` as a stream of HTML chunks.
+
+    Chunks are at least `chunk_size` characters long, except for the last one.
+    When `encoding` is given the chunks are encoded and yielded as `bytes`,
+    ready to be written to a socket.
+
+    The styles of the tree are compiled into a single `<style>` block, placed
+    inside `<head>` when the tree has one and after the root element otherwise.
+    `atomic_styles` switches to one class per CSS declaration.
+
+    Memoized elements are looked up in `cache` by their digest or their cache
+    key, a hit is spliced into the output without visiting the subtree.
+    """
+    chunks = _stream(element, chunk_size, pretty, indent, StyleSheet(atomic_styles), True, cache)
+    if encoding is None:
+        return chunks
+    return (chunk.encode(encoding) for chunk in chunks)
+
+
+class _Placeholder(HTMLElement):
+    __slots__ = ()
+    tag_name = "prymal-placeholder"  # type: ignore[assignment]
+
+
+SWAP_SCRIPT = """
+window.prymalSwap = function (id) {
+  const template = document.getElementById(id + "-content");
+  document.getElementById(id).replaceWith(template.content);
+  template.remove();
+};
+"""
+"""Defines `prymalSwap(id)`, replacing a placeholder with its streamed content."""
+
+
+async def render_async(
+    element: Element,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    pretty: bool = False,
+    indent: int = 2,
+    atomic_styles: bool = False,
+    cache: FragmentCache | None = fragment_cache,
+) -> AsyncIterator[str]:
+    """
+    Same as `render`, once the loads of the tree's components have been
+    resolved concurrently.
+
+    Deferred components don't hold the page back: the page is streamed with
+    their fallback in a placeholder, then each one's HTML follows at the end of
+    the response as soon as it has loaded, along with a script swapping it in.
+    A component whose load fails is logged and keeps its fallback, the rest of
+    the page is still streamed.
+    """
+    stylesheet = StyleSheet(atomic_styles)
+    ids = count()
+    loading: dict[asyncio.Future[Component], tuple[str, Component]] = {}
+
+    def suspend(root: Element) -> None:
+        for component in pending(root):
+            placeholder_id = f"prymal-{next(ids)}"
+            fallback = component.fallback()
+            component(
+                _Placeholder(Style(), *(() if fallback is None else (fallback,)), id=placeholder_id)
+            )
+            future = asyncio.ensure_future(resolve_deferred(component))
+            loading[future] = (placeholder_id, component)
+
+    try:
+        suspend(await resolve(element, defer=True))
+        for chunk in _stream(element, chunk_size, pretty, indent, stylesheet, True, cache):
+            yield chunk
+        if loading:
+            yield f"<script>{SWAP_SCRIPT}</script>"
+
+        while loading:
+            done, _ = await asyncio.wait(loading, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                placeholder_id, component = loading.pop(future)
+                content: Element | None = component
+                error = future.exception()
+                if error is None:
+                    suspend(component)
+                else:
+                    logger.error(
+                        "Loading %s failed", component.__class__.__qualname__, exc_info=error
+                    )
+                    content = component.fallback()
+
+                styles = StyleSheet(atomic_styles)
+                html = ""
+                if content is not None:
+                    chunks = _stream(content, sys.maxsize, pretty, indent, styles, False, cache)
+                    html = "".join(chunks)
+                css = styles.css(known=stylesheet)
+                stylesheet.update(styles)
+                yield (
+                    f'<template id="{placeholder_id}-content">'
+                    f"{f'<style>{css}</style>' if css else ''}{html}</template>"
+                    f'<script>prymalSwap("{placeholder_id}")</script>'
+                )
+    finally:
+        for future in loading:
+            future.cancel()
+
+
+def render_to_string(
+    element: Element,
+    *,
+    pretty: bool = False,
+    indent: int = 2,
+    atomic_styles: bool = False,
+    cache: FragmentCache | None = fragment_cache,
+    stylesheet: StyleSheet | None = None,
+) -> str:
+    """
+    Renders `element` into a single HTML string.
+
+    When a `stylesheet` is given the styles of the tree are registered on it
+    instead of being emitted, for fragments inserted into a page that already
+    has (or will receive) the rules.
+    """
+    emit_styles = stylesheet is None
+    if stylesheet is None:
+        stylesheet = StyleSheet(atomic_styles)
+    # With an unbounded chunk size the buffer is flushed once, at the end: the
+    # document is built by a single join and the generator itself only costs
+    # its creation and one resumption, about 1% of rendering a small fragment.
+    return "".join(_stream(element, sys.maxsize, pretty, indent, stylesheet, emit_styles, cache))
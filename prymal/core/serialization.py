@@ -0,0 +1,464 @@
+"""
+Binary serialization of `Element` trees.
+
+`dumps` encodes a tree in a compact, versioned format meant for caching
+rendered components, sending trees between processes and taking snapshots.
+`loads` decodes it back into instances of the original classes. Decoding never
+imports a class named by the data: it only instantiates the built-in elements
+and the classes and templates given to `register`, so untrusted data can't
+reach arbitrary code.
+
+The format starts with `b"PRYM"` and the format version, followed by sections
+made of a typecode (`B`, `H` or `I`, the narrowest fitting every value), the
+byte size of the data and the data itself, little-endian:
+
+- the UTF-8 blob of the string table and the length of every string in it
+- the class table: `2 * index` for a class of the built-in table,
+  `2 * string + 1` for a registered class, named `module:qualname`
+- the style table: the number of declarations of each style followed by their
+  name and value strings
+- one column per element field, elements being listed in preorder: class,
+  style (0 for none, else table index + 1), flags, number of children, of text
+  strings and of attributes
+- the payload, the variable sized parts of the elements in the same order:
+  key, text strings, attribute names and values, then the number of client
+  listeners followed by their event name and script
+
+Strings, classes and styles are stored once and referenced by index. Client
+listeners are kept since they are part of the markup, server listeners can't
+be serialized and are dropped. A component only keeps its rendered subtree,
+not the attributes set on the instance.
+
+Version 2 added client listeners, version 1 data is still decoded.
+"""
+
+import sys
+from array import array
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any, TypeVar
+
+from ..component import Component, unbuilt
+from .element import _NO_ATTRIBUTES, _NO_CHILDREN, Element, HTMLElement
+from .rendering.template import Prerendered, Template
+from .style import Style, StyleKey, StyleProperty
+
+MAGIC = b"PRYM"
+VERSION = 2
+
+_BUILTIN_CLASSES = (
+    "prymal.core.rendering.template:Prerendered",
+    "prymal.elements:Container",
+    "prymal.elements:Text",
+    "prymal.elements:TextInput",
+    *(
+        f"prymal.html.html_tags:{name}"
+        for name in (
+            "html base head link meta style title body address article aside footer header h1 h2 "
+            "h3 h4 h5 h6 hgroup main nav section search blockquote dd div dl dt figcaption "
+            "figure hr li menu ol p pre ul a abbr b bdi bdo br cite code data dfn em i kbd mark "
+            "q rp rt ruby s samp small span strong sub sup time u var wbr area audio img map "
+            "track video embed iframe object picture portal source svg math canvas noscript "
+            "script _del ins caption col colgroup table tbody td tfoot th thead tr button "
+            "datalist fieldset form input_ label legend meter optgroup option output progress "
+            "select textarea details dialog summary slot template"
+        ).split()
+    ),
+)
+"""Classes with a fixed ID in format version 1, new classes must be appended."""
+
+_BUILTIN_IDS = {name: index for index, name in enumerate(_BUILTIN_CLASSES)}
+
+_classes: dict[str, type[Element]] = {}
+_templates: dict[str, Template[Any]] = {}
+"""Classes and templates `loads` may instantiate besides the built-in ones, by name."""
+
+Registrable = TypeVar("Registrable", type[Element], Template[Any])
+
+_MEMOIZE = 1
+_KEY = 2
+_LISTENERS = 4
+
+_NONE, _FALSE, _TRUE, _STR, _INT, _FLOAT = range(6)
+
+
+def _class_name(cls: Any) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def register(value: Registrable) -> Registrable:
+    """
+    Allows `loads` to decode an element class or a compiled template that
+    isn't built into Prymal, such as a component. Usable as a decorator.
+    Decoding processes must import the module registering it, batch workers
+    included.
+    """
+    if isinstance(value, Template):
+        _templates[_class_name(value)] = value
+    elif isinstance(value, type) and issubclass(value, Element):
+        _classes[_class_name(value)] = value
+    else:
+        raise TypeError(f"Only element classes and templates can be registered, not {value!r}")
+    return value
+
+
+def _builtin(index: int) -> type[Element]:
+    module, _, qualname = _BUILTIN_CLASSES[index].partition(":")
+    return getattr(import_module(module), qualname)  # type: ignore[no-any-return]
+
+
+def _registered(table: dict[str, Any], name: str) -> Any:
+    try:
+        return table[name]
+    except KeyError:
+        raise ValueError(f"{name} isn't registered for deserialization") from None
+
+
+def _section(values: list[int] | bytes) -> bytes:
+    if isinstance(values, bytes):
+        data = values
+        typecode = "B"
+    else:
+        largest = max(values, default=0)
+        typecode = "B" if largest < 1 << 8 else "H" if largest < 1 << 16 else "I"
+        numbers = array(typecode, values)
+        if sys.byteorder == "big":
+            numbers.byteswap()
+        data = numbers.tobytes()
+    return typecode.encode() + len(data).to_bytes(4, "little") + data
+
+
+def _read_section(data: bytes, offset: int) -> tuple["array[int]", int]:
+    size = int.from_bytes(data[offset + 1 : offset + 5], "little")
+    numbers = array(chr(data[offset]))
+    numbers.frombytes(data[offset + 5 : offset + 5 + size])
+    if sys.byteorder == "big":
+        numbers.byteswap()
+    return numbers, offset + 5 + size
+
+
+class _Encoder:
+    __slots__ = ("strings", "payload")
+
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        self.payload: list[int] = []
+
+    def string(self, string: str) -> int:
+        strings = self.strings
+        try:
+            return strings[string]
+        except KeyError:
+            index = strings[string] = len(strings)
+            return index
+
+    def value(self, value: Any) -> None:
+        payload = self.payload
+        if value is None:
+            payload.append(_NONE)
+        elif value is True or value is False:
+            payload.append(_TRUE if value else _FALSE)
+        elif isinstance(value, str):
+            payload += (_STR, self.string(value))
+        elif isinstance(value, int):
+            payload += (_INT, self.string(str(value)))
+        elif isinstance(value, float):
+            payload += (_FLOAT, self.string(repr(value)))
+        else:
+            raise TypeError(f"Can't serialize a value of type {type(value).__name__}")
+
+    def encode(self, root: Element) -> bytes:
+        string = self.string
+        value = self.value
+        payload = self.payload
+        strings = self.strings
+        # Looked up per class and per style object, once per tree rather than
+        # once per element: components are the only classes with `unbuilt`
+        # elements, style keys are only hashed for each distinct object. The
+        # tree keeps its styles alive, their IDs can't be reused meanwhile.
+        class_ids: dict[type, tuple[int, bool]] = {}
+        style_ids: dict[StyleKey, int] = {}
+        style_objects: dict[int, int] = {}
+        # One row per element, split into the columns once the tree is walked.
+        rows: list[tuple[int, int, int, int, int, int]] = []
+        add_row = rows.append
+        add = payload.append
+
+        stack = [root]
+        pop = stack.pop
+        push = stack.extend
+        while stack:
+            element = pop()
+            cls = element.__class__
+            known = class_ids.get(cls)
+            if known is None:
+                known = class_ids[cls] = (len(class_ids), issubclass(cls, Component))
+            class_id, component = known
+            if component and unbuilt(element):
+                element.build()  # type: ignore[attr-defined]
+
+            if cls is Prerendered:
+                # A template is stored as its name followed by its values.
+                values = element.values  # type: ignore[attr-defined]
+                add(string(_class_name(element.template)))  # type: ignore[attr-defined]
+                for item in values:
+                    value(item)
+                add_row((class_id, 0, 0, 0, 0, len(values)))
+                continue
+
+            style = element.style
+            style_id = style_objects.get(id(style))
+            if style_id is None:
+                key = style.key
+                if key:
+                    style_id = style_ids.get(key)
+                    if style_id is None:
+                        style_id = style_ids[key] = len(style_ids)
+                    style_id += 1
+                else:
+                    style_id = 0
+                style_objects[id(style)] = style_id
+
+            flag = _MEMOIZE if element._memoize else 0
+            if element.key is not None:
+                flag |= _KEY
+                value(element.key)
+
+            text = element.text
+            for part in text:
+                index = strings.get(part)
+                if index is None:
+                    index = strings[part] = len(strings)
+                add(index)
+            mapping = element.attributes
+            attribute_count = 0
+            if mapping is not _NO_ATTRIBUTES:
+                attribute_count = len(mapping)
+                for name, item in mapping.items():
+                    add(string(name))
+                    value(item)
+
+            listeners = element._event_listeners
+            if listeners:
+                scripts = [
+                    (name, listener)
+                    for name, named in listeners.items()
+                    for listener in named
+                    if isinstance(listener, str)
+                ]
+                if scripts:
+                    flag |= _LISTENERS
+                    add(len(scripts))
+                    for name, script in scripts:
+                        payload += (string(name), string(script))
+
+            children = element._children
+            add_row((class_id, style_id, flag, len(children), len(text), attribute_count))
+            if children:
+                push(reversed(children))
+
+        class_table: list[int] = []
+        for cls in class_ids:
+            name = _class_name(cls)
+            builtin = _BUILTIN_IDS.get(name)
+            class_table.append(2 * builtin if builtin is not None else 2 * string(name) + 1)
+        style_table: list[int] = []
+        for key in style_ids:
+            style_table.append(len(key))
+            for name, item in key:
+                style_table += (string(name), string(item))
+
+        columns = zip(*rows)
+        encoded = [item.encode() for item in self.strings]
+        return b"".join(
+            (
+                MAGIC,
+                bytes((VERSION,)),
+                _section(b"".join(encoded)),
+                _section(list(map(len, encoded))),
+                _section(class_table),
+                _section(style_table),
+                *(_section(list(column)) for column in columns),
+                _section(payload),
+            )
+        )
+
+
+def dumps(root: Element) -> bytes:
+    """
+    Encodes a tree in the binary format.
+    """
+    return _Encoder().encode(root)
+
+
+def _value(payload: list[int], position: int, strings: list[str]) -> tuple[Any, int]:
+    kind = payload[position]
+    if kind == _NONE:
+        return None, position + 1
+    if kind == _FALSE or kind == _TRUE:
+        return kind == _TRUE, position + 1
+    string = strings[payload[position + 1]]
+    if kind == _INT:
+        return int(string), position + 2
+    if kind == _FLOAT:
+        return float(string), position + 2
+    return string, position + 2
+
+
+def _text_setter(cls: type[Element]) -> Callable[[Element, tuple[str, ...]], None] | None:
+    """
+    Sets the text of a new instance of `cls` straight into its slot, `None`
+    for classes that have no text.
+    """
+    text = getattr(cls, "text", ())
+    if isinstance(text, tuple):
+        return None
+    if isinstance(text, property):
+        # A new instance has no digest to reset, the setter can be skipped.
+        slot = getattr(cls, "_text", None)
+        return text.fset if slot is None else slot.__set__  # type: ignore[no-any-return]
+    return text.__set__  # type: ignore[no-any-return]
+
+
+def loads(data: bytes) -> Element:
+    """
+    Decodes a tree encoded by `dumps`.
+    """
+    if data[:4] != MAGIC:
+        raise ValueError("Not a serialized Prymal tree")
+    if not 1 <= data[4] <= VERSION:
+        raise ValueError(f"Unsupported serialization format version {data[4]}")
+
+    size = int.from_bytes(data[6:10], "little")
+    blob = data[10 : 10 + size]
+    offset = 10 + size
+    sections: list[list[int]] = []
+    while offset < len(data):
+        numbers, offset = _read_section(data, offset)
+        sections.append(numbers.tolist())
+    (
+        lengths,
+        class_table,
+        style_table,
+        classes,
+        styles,
+        flags,
+        children,
+        texts,
+        attributes,
+        payload,
+    ) = sections
+
+    strings: list[str] = []
+    start = 0
+    for length in lengths:
+        strings.append(blob[start : start + length].decode())
+        start += length
+
+    types = [
+        _builtin(code >> 1) if code & 1 == 0 else _registered(_classes, strings[code >> 1])
+        for code in class_table
+    ]
+    # What the loop needs to know of each class, looked up once per class.
+    kinds = [(cls, _text_setter(cls), issubclass(cls, HTMLElement)) for cls in types]
+
+    style_objects: list[Style] = [Style()]
+    position = 0
+    while position < len(style_table):
+        end = position + 1 + 2 * style_table[position]
+        declarations = style_table[position + 1 : end]
+        properties = (
+            StyleProperty(strings[name], strings[item])
+            for name, item in zip(declarations[0::2], declarations[1::2])
+        )
+        style_objects.append(Style(*properties).intern())
+        position = end
+
+    root: Element | None = None
+    # The parent of the next element and how many children it still waits
+    # for, along with the ancestors still waiting for more.
+    parent: Element | None = None
+    left = 0
+    ancestors: list[tuple[Element, int]] = []
+    string_at = strings.__getitem__
+    position = 0
+    for kind, style, flag, child_count, text_count, attribute_count in zip(
+        map(kinds.__getitem__, classes),
+        map(style_objects.__getitem__, styles),
+        flags,
+        children,
+        texts,
+        attributes,
+    ):
+        cls, set_text, attributed = kind
+        element: Element
+        if cls is Prerendered:
+            template = _registered(_templates, strings[payload[position]])
+            position += 1
+            values = []
+            for _ in range(attribute_count):
+                item, position = _value(payload, position, strings)
+                values.append(item)
+            element = Prerendered(template, tuple(values))
+        else:
+            element = cls.__new__(cls)
+            element._event_listeners = None
+            element._digest = None
+            element.style = style
+            element._memoize = flag & _MEMOIZE == _MEMOIZE
+            if flag & _KEY:
+                element.key, position = _value(payload, position, strings)
+            else:
+                element.key = None
+
+            if text_count == 1:
+                set_text(element, (strings[payload[position]],))  # type: ignore[misc]
+                position += 1
+            elif text_count:
+                end = position + text_count
+                text = tuple(map(string_at, payload[position:end]))
+                set_text(element, text)  # type: ignore[misc]
+                position = end
+            elif set_text is not None:
+                set_text(element, ())
+
+            if attribute_count:
+                mapping = {}
+                for _ in range(attribute_count):
+                    name = strings[payload[position]]
+                    if payload[position + 1] == _STR:
+                        mapping[name] = strings[payload[position + 2]]
+                        position += 3
+                    else:
+                        mapping[name], position = _value(payload, position + 1, strings)
+                element._attributes = mapping  # type: ignore[attr-defined]
+            elif attributed:
+                element._attributes = _NO_ATTRIBUTES  # type: ignore[attr-defined]
+
+            if flag & _LISTENERS:
+                end = position + 1 + 2 * payload[position]
+                scripts = payload[position + 1 : end]
+                for event, script in zip(scripts[0::2], scripts[1::2]):
+                    element.event_listeners.add(strings[event], strings[script])
+                position = end
+
+            element._children = [] if child_count else _NO_CHILDREN
+
+        if parent is None:
+            root = element
+            element.parent = element
+        else:
+            element.parent = parent
+            parent._children.append(element)  # type: ignore[union-attr]
+            left -= 1
+        if child_count:
+            if left:
+                ancestors.append((parent, left))  # type: ignore[arg-type]
+            parent, left = element, child_count
+        else:
+            while not left and ancestors:
+                parent, left = ancestors.pop()
+
+    if root is None:
+        raise ValueError("Serialized tree has no elements")
+    return root
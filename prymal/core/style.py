@@ -3,41 +3,63 @@ Core Styling Functionality
 """
 
 from collections.abc import Hashable
-from typing import Self, TypeAlias
+from typing import TypeAlias
+from weakref import WeakValueDictionary
 
-from .element import ElementType
-from .utils import AbstractHashable, generate_unique_id
+from .persistent import PersistentMap
+from .utils import AbstractHashable
 
 StyleType: TypeAlias = "Style"
 StylePropertyType: TypeAlias = "StyleProperty"
+StyleKey: TypeAlias = tuple[tuple[str, str], ...]
+
+_MAX_COMBINATIONS = 4096
+"""Upper bound on the number of cached `&` results before the cache is reset."""
+
+_interned: "WeakValueDictionary[StyleKey, Style]" = WeakValueDictionary()
+_combinations: "dict[tuple[Style, Style], Style]" = {}
 
 
 class StyleProperty:
     """
     A property for a style class. Similair to a CSS style, whereas a `Style` would be a CSS stylesheet.
+
+    Properties are equal when they set the same CSS property to the same value,
+    however the name is spelled (`font_weight` or `font-weight`).
     """
-    __slots__ = ("name", "value")
-    
+
+    __slots__ = ("name", "value", "_declaration")
+
     def __init__(self, name: str, value: Hashable) -> None:
         self.name = name
         self.value = value
+        self._declaration: tuple[str, str] | None = None
 
-    @property
-    def __id(self) -> tuple[str, Hashable]:
-        return (self.name, self.value)
-    
     def __hash__(self) -> int:
-        try:
-            return hash(self.__id)
+        return hash((self.css_name, self.value))
 
-    def __eq__(self, other: StylePropertyType) -> bool:
-        if isinstance(other, StylePropertyType):
-            return self._id == other.__id
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StyleProperty):
+            return NotImplemented
+        return self.css_name == other.css_name and self.value == other.value
+
+    @property
+    def css_name(self) -> str:
+        return self.name.casefold().replace("_", "-")
+
+    @property
+    def declaration(self) -> tuple[str, str]:
+        """
+        The CSS property name and value, computed once and shared by every
+        style holding the property.
+        """
+        if self._declaration is None:
+            self._declaration = (self.css_name, str(self.value))
+        return self._declaration
 
-        return False
-    
     def __repr__(self) -> str:
-        return f"{self.name.casefold().replace("_", "-")}: {self.value};"
+        return f"{self.css_name}: {self.value};"
+
 
 class Style(AbstractHashable):
     """
@@ -53,24 +75,69 @@ class Style(AbstractHashable):
     Applying a function to an element is as simple as using the `@` or `@=`
     operators.
 
+    Properties are kept in a mapping keyed by CSS property name, in the order
+    they were last set: setting a property again moves it after the others, so
+    a style holds one declaration per property however it was composed and
+    shorthands (`margin`) still override the longhands (`margin-top`) set
+    before them, and the other way around. The mapping is persistent, a
+    combined style shares it with the styles it was made of and only
+    allocates for the properties the right hand side sets, unless the right
+    hand side sets properties again.
+
+    Styles are hash-consed: `intern()` returns one canonical instance per set of
+    effective declarations and `&` always returns canonical instances, caching
+    the result of every combination it has seen. Styles with the same look can
+    therefore be compared by identity. Because canonical instances are shared,
+    styles must not be modified after creation, `&=` rebinds instead of
+    mutating.
+
     Example usage:
 
     ```py
     emphasis = Style(font_style="bold")
 
-    Container()(
-        Text("Hello World!") @ emphasis
-    ) @ Style(flex_direction = "horizontal")
+    Container()(Text("Hello World!") @ emphasis) @ Style(flex_direction="horizontal")
     ```
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        self._elements: set[ElementType] = set()
-        self.properties: list[Any] = []
+    def __init__(self, *properties: StyleProperty, **kwargs: Hashable) -> None:
+        ordered: dict[str, StyleProperty] = {}
+        for prop in (*properties, *map(StyleProperty, kwargs, kwargs.values())):
+            ordered.pop(prop.css_name, None)
+            ordered[prop.css_name] = prop
+        self.properties: PersistentMap[str, StyleProperty] = PersistentMap(ordered.items())
+        self._key: StyleKey | None = None
+        self._canonical: StyleType | None = None
+
+    def declarations(self) -> dict[str, str]:
+        """
+        The CSS declarations of the style keyed by CSS property name. When a
+        property was set more than once the last value wins.
+        """
+        return dict(prop.declaration for prop in self.properties.values())
+
+    @property
+    def key(self) -> StyleKey:
+        """
+        The effective declarations in order. Two styles with the same key
+        produce the same CSS.
+        """
+        if self._key is None:
+            self._key = tuple([prop.declaration for prop in self.properties.values()])
+        return self._key
+
+    def intern(self) -> StyleType:
+        """
+        Returns the canonical style for this style's declarations.
+        """
+        if self._canonical is None:
+            self._canonical = _interned.setdefault(self.key, self)
+        return self._canonical
 
     def copy(self) -> StyleType:
-        new_style = super(self.__class__)
-        new_style.properties = self.properties.copy()
+        new_style = self.__class__()
+        # Nothing is copied, the map can't change.
+        new_style.properties = self.properties
         return new_style
 
     def __copy__(self) -> StyleType:
@@ -83,16 +150,34 @@ class Style(AbstractHashable):
         Example:
 
         ```py
-        Style("red") & Style(flex_direction = "horizontal")
+        Style("red") & Style(flex_direction="horizontal")
         ```
         """
-        new_style = self.copy()
-        new_style.properties += other_style.properties
-        return new_style
-
-    def __iand__(self, other_style: StyleType) -> Self:
-        self.properties += other_style.properties
-        return self
+        pair = (self.intern(), other_style.intern())
+        try:
+            return _combinations[pair]
+        except KeyError:
+            pass
+
+        new_style = self.__class__()
+        left, right = pair[0].properties, pair[1].properties
+        if any(name in left for name in right):
+            # Properties set again move last, the map is rebuilt in that order.
+            new_style.properties = PersistentMap(
+                [(name, prop) for name, prop in left.items() if name not in right]
+                + list(right.items())
+            )
+        else:
+            new_style.properties = left.update(right)
+        combined = new_style.intern()
+
+        if len(_combinations) >= _MAX_COMBINATIONS:
+            _combinations.clear()
+        _combinations[pair] = combined
+        return combined
+
+    def __iand__(self, other_style: StyleType) -> StyleType:
+        return self & other_style
 
-    def __repr__(self) -> int:
-        return "Style({self.id})"
+    def __repr__(self) -> str:
+        return f"Style({self.id})"
@@ -0,0 +1,75 @@
+"""
+Tree traversal shared by the renderer, style collection and any other pass
+over an `Element` tree.
+
+Every walk uses an explicit stack instead of recursion, so the depth of a tree
+is only bounded by memory and each visited node costs the same amount of work
+regardless of how deep it is nested.
+
+All walks accept a `prune` predicate. It is called once an element has been
+handed to the caller, and when it returns `True` the element's children are
+skipped.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from enum import IntEnum, auto
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .element import Element
+
+
+class Visit(IntEnum):
+    Enter = auto()
+    Exit = auto()
+
+
+Prune = Callable[["Element"], bool]
+
+
+def _children(element: Element, prune: Prune | None) -> Iterator[Element]:
+    if prune is not None and prune(element):
+        return iter(())
+    return iter(element._children)
+
+
+def walk(root: Element, prune: Prune | None = None) -> Iterator[tuple[Visit, Element]]:
+    """
+    Yields `(Visit.Enter, element)` when an element is reached and
+    `(Visit.Exit, element)` once all of its children have been visited.
+    """
+    yield Visit.Enter, root
+    stack = [(root, _children(root, prune))]
+    while stack:
+        element, children = stack[-1]
+        for child in children:
+            yield Visit.Enter, child
+            stack.append((child, _children(child, prune)))
+            break
+        else:
+            stack.pop()
+            yield Visit.Exit, element
+
+
+def preorder(root: Element, prune: Prune | None = None) -> Iterator[Element]:
+    """
+    Yields every element of the tree, parents before their children.
+    """
+    stack = [root]
+    while stack:
+        element = stack.pop()
+        yield element
+        if prune is None or not prune(element):
+            stack.extend(reversed(element._children))
+
+
+def postorder(root: Element, prune: Prune | None = None) -> Iterator[Element]:
+    """
+    Yields every element of the tree, children before their parents. Pruned
+    elements are still yielded, only their children are skipped.
+    """
+    for visit, element in walk(root, prune):
+        if visit is Visit.Exit:
+            yield element
@@ -1,13 +1,14 @@
 from collections import defaultdict
-from collections.abc import MutableSet
-from threading import Lock
+from collections.abc import Hashable, Iterator, MutableSet
+from contextlib import contextmanager
+from itertools import count
 from types import NoneType
 from typing import Callable, TypeVar
 
 T = TypeVar("T")
 
 
-class OrderedSet(defaultdict, MutableSet):
+class OrderedSet(defaultdict, MutableSet):  # type: ignore[misc]
     """https://stackoverflow.com/questions/1653970/does-python-have-an-ordered-set"""
 
     def __init__(self, default_factory: Callable = NoneType) -> None:
@@ -33,10 +34,10 @@ class OrderedSet(defaultdict, MutableSet):
         return self >= other and self != other
 
     def __repr__(self):
-        return f"OrderedSet([{", ".join(map(repr, self))}])"
+        return f"OrderedSet([{', '.join(map(repr, self))}])"
 
     def __str__(self):
-        return f"{", ".join(map(repr, self))}"
+        return f"{', '.join(map(repr, self))}"
 
     difference = property(lambda self: self.__sub__)
     difference_update = property(lambda self: self.__isub__)
@@ -50,29 +51,67 @@ class OrderedSet(defaultdict, MutableSet):
 
 
 class IDGenerator:
-    __slots__ = ("lock", "_id")
+    """
+    Hands out increasing IDs starting at 1. Backed by `itertools.count`, whose
+    `next` runs atomically under the GIL, so no lock is taken and threads
+    rendering concurrently never contend on it.
+    """
 
-    def __init__(self) -> None:
-        self.lock = Lock()
-        self._id = 0
+    __slots__ = ("_ids",)
+
+    def __init__(self, start: int = 1) -> None:
+        self._ids = count(start)
 
     def __call__(self) -> int:
-        with self.lock:
-            self._id += 1
-            return self._id
+        return next(self._ids)
+
 
+DETERMINISTIC_START = 1 << 62
+"""
+First ID handed out under `deterministic_ids`. Regular IDs stay below it, so
+the two never collide.
+"""
 
-_id_generators = defaultdict(IDGenerator)
+_id_generators: dict[Hashable, IDGenerator] = {}
+_id_start = 1
 
 
 def generate_unique_id(key: str | type | None = None) -> int:
     """
     Used for generating unique IDs. Each key will use a different ID generator.
     """
-    return _id_generators[key]()
+    try:
+        generator = _id_generators[key]
+    except KeyError:
+        # `setdefault` is atomic, threads racing on a new key share a generator.
+        generator = _id_generators.setdefault(key, IDGenerator(_id_start))
+    return generator()
+
+
+@contextmanager
+def deterministic_ids() -> Iterator[None]:
+    """
+    Restarts every ID generator at `DETERMINISTIC_START` for the duration of
+    the block, so building the same tree produces the same IDs and
+    reproducible output. Afterwards the generators resume where they were.
+    Meant for tests and snapshots, not for use while other threads build
+    elements.
+
+    Objects built in two such blocks can share an ID, `AbstractHashable`
+    compares by identity so they are still told apart.
+    """
+    global _id_generators, _id_start
+    previous = _id_generators
+    _id_generators, _id_start = {}, DETERMINISTIC_START
+    try:
+        yield
+    finally:
+        _id_generators, _id_start = previous, 1
 
 
 class AbstractHashable:
+    __slots__ = ("__id",)
+    __id: int
 
     @property
     def id(self) -> int:
@@ -87,6 +126,6 @@ class AbstractHashable:
         return self.id
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-        return self.id == other.id
+        # IDs are only unique among objects built outside of
+        # `deterministic_ids`, identity always is.
+        return self is other
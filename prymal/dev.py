@@ -0,0 +1,353 @@
+"""
+Development server with hot reloading.
+
+`DevServer` serves an `Application` and watches the project's source. When a
+module changes only that module and the modules importing it are re-imported,
+the pages open in a browser are rendered again and the difference is pushed to
+them over a websocket, instead of restarting the whole process.
+"""
+
+import ast
+import asyncio
+import importlib
+import logging
+import secrets
+import sys
+import traceback
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable, Iterator
+from graphlib import CycleError, TopologicalSorter
+from importlib.util import resolve_name
+from pathlib import Path
+from time import perf_counter
+from types import ModuleType
+from typing import Any
+
+from litestar import Litestar, Request, Response, WebSocket, get, post, websocket
+from litestar.enums import MediaType
+from litestar.exceptions import WebSocketDisconnect
+from litestar.handlers import BaseRouteHandler
+from litestar.response import Stream
+from watchfiles import PythonFilter, awatch
+
+from .application import EVENTS_PATH, Application
+from .component import resolve
+from .core.element import Element
+from .core.rendering.diff import PATCH_SCRIPT, diff, dumps
+from .core.traversal import preorder
+from .live import LIVE_PATH
+
+logger = logging.getLogger("prymal.dev")
+
+SOCKET_PATH = "/_prymal/dev"
+
+MAX_VIEWS = 256
+"""Rendered pages remembered for browsers that haven't connected their socket yet."""
+
+
+def _imports(name: str, path: Path, is_package: bool) -> set[str]:
+    """
+    Absolute names of the modules imported by a module. `from package import
+    name` also lists `package.name` since it may be a submodule.
+    """
+    package = name if is_package else name.rpartition(".")[0]
+    imported: set[str] = set()
+    for node in ast.walk(ast.parse(path.read_bytes(), str(path))):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                base = resolve_name("." * node.level + (node.module or ""), package)
+            except ImportError:
+                continue
+            imported.add(base)
+            imported.update(f"{base}.{alias.name}" for alias in node.names)
+    return imported
+
+
+class ModuleGraph:
+    """
+    Import graph of the project's modules, the imported modules whose file
+    lives under one of the roots.
+    """
+
+    def __init__(self, roots: Iterable[Path]) -> None:
+        self.roots = [root.resolve() for root in roots]
+        self.files: dict[Path, str] = {}
+        self.imports: dict[str, set[str]] = {}
+
+    def scan(self) -> None:
+        for name, module in list(sys.modules.items()):
+            self.add(name, module)
+
+    def add(self, name: str, module: ModuleType) -> None:
+        file = getattr(module, "__file__", None)
+        if file is None or not file.endswith(".py"):
+            return
+        path = Path(file).resolve()
+        if not any(path.is_relative_to(root) for root in self.roots):
+            return
+        self.files[path] = name
+        try:
+            self.imports[name] = _imports(name, path, hasattr(module, "__path__"))
+        except (OSError, SyntaxError):
+            self.imports.setdefault(name, set())
+
+    def dependents(self, names: set[str]) -> set[str]:
+        """
+        The given modules and every project module importing them, directly
+        or not.
+        """
+        importers: dict[str, set[str]] = {}
+        for name, imported in self.imports.items():
+            for dependency in imported:
+                importers.setdefault(dependency, set()).add(name)
+
+        found = set(names)
+        pending = list(names)
+        while pending:
+            for importer in importers.get(pending.pop(), ()):
+                if importer not in found:
+                    found.add(importer)
+                    pending.append(importer)
+        return found
+
+    def order(self, names: set[str]) -> list[str]:
+        """
+        The given modules with dependencies before the modules importing them.
+        """
+        graph = {name: self.imports.get(name, set()) & names for name in names}
+        try:
+            return list(TopologicalSorter(graph).static_order())
+        except CycleError:
+            return sorted(names)
+
+    def reload(self, paths: Iterable[Path]) -> list[str]:
+        """
+        Re-imports the modules of the changed files and their dependents,
+        returns the names of the reloaded modules in reload order.
+        """
+        changed = {self.files[path] for path in map(Path.resolve, paths) if path in self.files}
+        if not changed:
+            return []
+
+        reloaded = self.order(self.dependents(changed))
+        for name in reloaded:
+            module = sys.modules.get(name)
+            if module is not None:
+                self.add(name, importlib.reload(module))
+        return reloaded
+
+
+class _View:
+    """A page as it was last sent to one browser tab."""
+
+    __slots__ = ("path", "params", "root", "socket")
+
+    def __init__(self, path: str, params: dict[str, Any], root: Element) -> None:
+        self.path = path
+        self.params = params
+        self.root = root
+        self.socket: WebSocket | None = None
+
+
+def _client_script(view_id: str, root: Element) -> str:
+    mount = "document" if root.tag_name == "html" else "document.body"
+    return f"""<script>{PATCH_SCRIPT}
+(() => {{
+  const scheme = location.protocol === "https:" ? "wss" : "ws";
+  const socket = new WebSocket(`${{scheme}}://${{location.host}}{SOCKET_PATH}`);
+  socket.onopen = () => socket.send("{view_id}");
+  socket.onmessage = (event) => {{
+    if (event.data === "reload") location.reload();
+    else prymalPatch({mount}, JSON.parse(event.data));
+  }};
+  socket.onclose = () => setTimeout(() => location.reload(), 1000);
+}})();
+</script>"""
+
+
+class DevServer:
+    """
+    Serves the `Application` found at `target` (`"module:attribute"`) and
+    hot reloads it when a file under one of the `roots` changes.
+    """
+
+    def __init__(self, target: str, roots: Iterable[Path]) -> None:
+        self.module, _, self.attribute = target.partition(":")
+        self.graph = ModuleGraph(roots)
+        self.views: OrderedDict[str, _View] = OrderedDict()
+        self._watcher: asyncio.Task[None] | None = None
+        self._stop = asyncio.Event()
+
+    @property
+    def app(self) -> Application:
+        """
+        The application, looked up again after every reload.
+        """
+        return getattr(sys.modules[self.module], self.attribute or "app")
+
+    def load(self) -> Litestar:
+        """
+        Imports the application and builds the ASGI app serving it.
+        """
+        importlib.import_module(self.module)
+        self.graph.scan()
+
+        handlers: list[BaseRouteHandler] = [self._page_handler(path) for path in self.app.pages]
+        handlers.append(websocket(SOCKET_PATH)(self._socket_handler))
+        # The application's own routes, served by the application of the
+        # latest reload like the pages are.
+        if self.app.sessions is None:
+            path = f"{EVENTS_PATH}/{{page:str}}"
+            handlers.append(post(path, name="prymal-events")(self._dispatch))
+        else:
+            handlers.append(websocket(LIVE_PATH, name="prymal-live")(self._live))
+        handlers.extend(self.app.litestar_options.get("route_handlers", ()))
+        return Litestar(
+            route_handlers=handlers,
+            on_startup=[self._start],
+            on_shutdown=[self._shutdown],
+            debug=True,
+        )
+
+    def _page_handler(self, path: str) -> BaseRouteHandler:
+        async def handler(request: Request) -> Stream:
+            params = dict(request.path_params)
+            root = await resolve(self.app.pages[path](**params))
+
+            view_id = secrets.token_hex(8)
+            self.views[view_id] = _View(path, params, root)
+            self._forget_stale_views()
+            return Stream(self._stream(root, view_id), media_type=MediaType.HTML)
+
+        return get(path, name=f"dev:{path}")(handler)
+
+    async def _dispatch(self, request: Request, page: str) -> Response:
+        return await self.app.dispatch(request, page)
+
+    async def _live(self, socket: WebSocket) -> None:
+        sessions = self.app.sessions
+        if sessions is None:
+            # Live mode was turned off by a reload.
+            await socket.close()
+            return
+        await sessions.serve(socket)
+
+    def _stream(self, root: Element, view_id: str) -> Iterator[bytes]:
+        yield from self.app.stream(root)
+        yield _client_script(view_id, root).encode()
+
+    def _forget_stale_views(self) -> None:
+        stale = [view_id for view_id, view in self.views.items() if view.socket is None]
+        for view_id in stale[: max(len(stale) - MAX_VIEWS, 0)]:
+            del self.views[view_id]
+
+    async def _socket_handler(self, socket: WebSocket) -> None:
+        await socket.accept()
+        view_id = await socket.receive_text()
+        view = self.views.get(view_id)
+        if view is None:
+            await socket.send_text("reload")
+            await socket.close()
+            return
+
+        view.socket = socket
+        try:
+            while True:
+                await socket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            self.views.pop(view_id, None)
+
+    async def _start(self) -> None:
+        self._watcher = asyncio.create_task(self._watch())
+
+    async def _shutdown(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            await self._watcher
+
+    async def _changes(self) -> AsyncIterator[list[Path]]:
+        # The default debounce of 1.6s alone would blow the edit to paint budget.
+        async for changes in awatch(
+            *self.graph.roots,
+            watch_filter=PythonFilter(),
+            debounce=50,
+            step=10,
+            stop_event=self._stop,
+        ):
+            yield [Path(path) for _, path in changes]
+
+    async def _watch(self) -> None:
+        async for paths in self._changes():
+            started = perf_counter()
+            try:
+                reloaded = self.graph.reload(paths)
+            except Exception:
+                logger.error("Reload failed:\n%s", traceback.format_exc())
+                continue
+            if not reloaded:
+                continue
+
+            patched = await self.refresh(set(reloaded))
+            logger.info(
+                "Reloaded %d module(s), patched %d page(s) in %.0f ms",
+                len(reloaded),
+                patched,
+                (perf_counter() - started) * 1000,
+            )
+
+    def _affected(self, view: _View, reloaded: set[str]) -> bool:
+        page = self.app.pages.get(view.path)
+        if page is None:
+            return False
+        if page.__module__ in reloaded:
+            return True
+        return any(element.__class__.__module__ in reloaded for element in preorder(view.root))
+
+    async def refresh(self, reloaded: set[str]) -> int:
+        """
+        Renders the connected pages affected by the reloaded modules again and
+        sends each browser the patches to its page. Returns the number of
+        patched pages.
+        """
+        patched = 0
+        for view_id, view in list(self.views.items()):
+            if view.socket is None or not self._affected(view, reloaded):
+                continue
+            try:
+                root = await resolve(self.app.pages[view.path](**view.params))
+            except Exception:
+                logger.error("Rendering %s failed:\n%s", view.path, traceback.format_exc())
+                continue
+
+            patches = diff(view.root, root)
+            view.root = root
+            if not patches:
+                continue
+            try:
+                await view.socket.send_text(dumps(patches))
+            except Exception:
+                # The tab went away meanwhile, its socket handler may not have
+                # noticed yet.
+                logger.info("Dropping disconnected view of %s", view.path)
+                self.views.pop(view_id, None)
+                continue
+            patched += 1
+        return patched
+
+
+def run(target: str, roots: Iterable[Path], host: str, port: int) -> None:
+    """
+    Runs the development server with uvicorn.
+    """
+    try:
+        import uvicorn
+    except ImportError:
+        raise SystemExit("prymal dev needs uvicorn, install it with `pip install prymal[dev]`")
+
+    sys.path.insert(0, str(Path.cwd()))
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    uvicorn.run(DevServer(target, roots).load(), host=host, port=port)
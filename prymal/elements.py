@@ -14,15 +14,19 @@ class Container(Element):
     in Android.
     """
 
+    __slots__ = ()
+    tag_name = "div"
+
     def __init__(self, style: Style | None = None, *children: Element) -> None:
-        super().__init__()
-        for element in children:
-            element.parent = self
-        self.children: list[ElementType] = list(children)
+        if style is None:
+            super().__init__()
+        else:
+            super().__init__(style)
+        self(*children)
 
-    def __iadd__(self, element: Self) -> None:
-        self.children.append(element)
-        element.parent = self
+    def __iadd__(self, element: ElementType) -> Self:
+        self(element)
+        return self
 
 
 class Text(Element):
@@ -30,9 +34,21 @@ class Text(Element):
     Display rich text supporting styling and interactivity.
     """
 
+    __slots__ = ("_text",)
+    tag_name = "p"
+
     def __init__(self, *text: str) -> None:
         super().__init__()
-        self.text = text
+        self._text = text
+
+    @property  # type: ignore[override]
+    def text(self) -> tuple[str, ...]:
+        return self._text
+
+    @text.setter
+    def text(self, text: tuple[str, ...]) -> None:
+        self._text = text
+        self._invalidate()
 
 
 class TextInput(Element):
@@ -40,6 +56,9 @@ class TextInput(Element):
     Element for retrieving text from the user.
     """
 
+    __slots__ = ()
+    tag_name = "input"
+    self_closing = True
+
     def __init__(self) -> None:
         super().__init__()
-        super().__init__()
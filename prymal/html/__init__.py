@@ -0,0 +1,66 @@
+"""
+HTML tags, one `HTMLElement` subclass per tag.
+
+```py
+from prymal.html import a, div
+```
+
+Tag classes are created the first time they are imported, from the table of
+tag names below, so a worker only pays for the tags it renders. Their
+documentation lives in `prymal.html.docs` and is only loaded when read.
+"""
+
+from typing import Any
+
+from ..core.element import HTMLElement
+
+TAGS = (
+    "html base head link meta style title body address article aside footer header h1 h2 h3 h4 "
+    "h5 h6 hgroup main nav section search blockquote dd div dl dt figcaption figure hr li menu "
+    "ol p pre ul a abbr b bdi bdo br cite code data dfn em i kbd mark q rp rt ruby s samp small "
+    "span strong sub sup time u var wbr area audio img map track video embed iframe object "
+    "picture portal source svg math canvas noscript script _del ins caption col colgroup table "
+    "tbody td tfoot th thead tr button datalist fieldset form input_ label legend meter optgroup "
+    "option output progress select textarea details dialog summary slot template"
+).split()
+"""Class names of the tags, `_del` and `input_` avoiding Python keywords and builtins."""
+
+ALIASES = {"del_": "_del"}
+
+__all__ = [*TAGS, *ALIASES]
+
+
+class _Tag(type):
+    # Class docstrings are looked up on the metaclass first, which lets the
+    # generated tags load theirs on demand.
+    @property
+    def __doc__(cls) -> str | None:  # type: ignore[override]
+        doc = cls.__dict__.get("__doc__")
+        if doc is None and cls.__dict__.get("_generated"):
+            from inspect import cleandoc
+
+            from .docs import DOCS
+
+            doc = cleandoc(DOCS[cls.__name__])
+        return doc
+
+
+def _create(name: str) -> type[HTMLElement]:
+    return _Tag(
+        name,
+        (HTMLElement,),
+        {"__slots__": (), "__module__": "prymal.html.html_tags", "_generated": True},
+    )
+
+
+def __getattr__(name: str) -> Any:
+    name = ALIASES.get(name, name)
+    if name not in TAGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Two threads racing here may both create the class, `setdefault` makes
+    # them agree on one.
+    return globals().setdefault(name, _create(name))
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
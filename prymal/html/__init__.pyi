@@ -0,0 +1,125 @@
+# Generated from `TAGS`, declares the classes created on demand by `__getattr__`.
+
+from ..core.element import HTMLElement
+
+TAGS: list[str]
+ALIASES: dict[str, str]
+__all__: list[str]
+
+class html(HTMLElement): ...
+class base(HTMLElement): ...
+class head(HTMLElement): ...
+class link(HTMLElement): ...
+class meta(HTMLElement): ...
+class style(HTMLElement): ...
+class title(HTMLElement): ...
+class body(HTMLElement): ...
+class address(HTMLElement): ...
+class article(HTMLElement): ...
+class aside(HTMLElement): ...
+class footer(HTMLElement): ...
+class header(HTMLElement): ...
+class h1(HTMLElement): ...
+class h2(HTMLElement): ...
+class h3(HTMLElement): ...
+class h4(HTMLElement): ...
+class h5(HTMLElement): ...
+class h6(HTMLElement): ...
+class hgroup(HTMLElement): ...
+class main(HTMLElement): ...
+class nav(HTMLElement): ...
+class section(HTMLElement): ...
+class search(HTMLElement): ...
+class blockquote(HTMLElement): ...
+class dd(HTMLElement): ...
+class div(HTMLElement): ...
+class dl(HTMLElement): ...
+class dt(HTMLElement): ...
+class figcaption(HTMLElement): ...
+class figure(HTMLElement): ...
+class hr(HTMLElement): ...
+class li(HTMLElement): ...
+class menu(HTMLElement): ...
+class ol(HTMLElement): ...
+class p(HTMLElement): ...
+class pre(HTMLElement): ...
+class ul(HTMLElement): ...
+class a(HTMLElement): ...
+class abbr(HTMLElement): ...
+class b(HTMLElement): ...
+class bdi(HTMLElement): ...
+class bdo(HTMLElement): ...
+class br(HTMLElement): ...
+class cite(HTMLElement): ...
+class code(HTMLElement): ...
+class data(HTMLElement): ...
+class dfn(HTMLElement): ...
+class em(HTMLElement): ...
+class i(HTMLElement): ...
+class kbd(HTMLElement): ...
+class mark(HTMLElement): ...
+class q(HTMLElement): ...
+class rp(HTMLElement): ...
+class rt(HTMLElement): ...
+class ruby(HTMLElement): ...
+class s(HTMLElement): ...
+class samp(HTMLElement): ...
+class small(HTMLElement): ...
+class span(HTMLElement): ...
+class strong(HTMLElement): ...
+class sub(HTMLElement): ...
+class sup(HTMLElement): ...
+class time(HTMLElement): ...
+class u(HTMLElement): ...
+class var(HTMLElement): ...
+class wbr(HTMLElement): ...
+class area(HTMLElement): ...
+class audio(HTMLElement): ...
+class img(HTMLElement): ...
+class map(HTMLElement): ...
+class track(HTMLElement): ...
+class video(HTMLElement): ...
+class embed(HTMLElement): ...
+class iframe(HTMLElement): ...
+class object(HTMLElement): ...
+class picture(HTMLElement): ...
+class portal(HTMLElement): ...
+class source(HTMLElement): ...
+class svg(HTMLElement): ...
+class math(HTMLElement): ...
+class canvas(HTMLElement): ...
+class noscript(HTMLElement): ...
+class script(HTMLElement): ...
+class _del(HTMLElement): ...
+class ins(HTMLElement): ...
+class caption(HTMLElement): ...
+class col(HTMLElement): ...
+class colgroup(HTMLElement): ...
+class table(HTMLElement): ...
+class tbody(HTMLElement): ...
+class td(HTMLElement): ...
+class tfoot(HTMLElement): ...
+class th(HTMLElement): ...
+class thead(HTMLElement): ...
+class tr(HTMLElement): ...
+class button(HTMLElement): ...
+class datalist(HTMLElement): ...
+class fieldset(HTMLElement): ...
+class form(HTMLElement): ...
+class input_(HTMLElement): ...
+class label(HTMLElement): ...
+class legend(HTMLElement): ...
+class meter(HTMLElement): ...
+class optgroup(HTMLElement): ...
+class option(HTMLElement): ...
+class output(HTMLElement): ...
+class progress(HTMLElement): ...
+class select(HTMLElement): ...
+class textarea(HTMLElement): ...
+class details(HTMLElement): ...
+class dialog(HTMLElement): ...
+class summary(HTMLElement): ...
+class slot(HTMLElement): ...
+class template(HTMLElement): ...
+
+del_ = _del
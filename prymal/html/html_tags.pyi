@@ -0,0 +1,118 @@
+from . import (
+    html as html,
+    base as base,
+    head as head,
+    link as link,
+    meta as meta,
+    style as style,
+    title as title,
+    body as body,
+    address as address,
+    article as article,
+    aside as aside,
+    footer as footer,
+    header as header,
+    h1 as h1,
+    h2 as h2,
+    h3 as h3,
+    h4 as h4,
+    h5 as h5,
+    h6 as h6,
+    hgroup as hgroup,
+    main as main,
+    nav as nav,
+    section as section,
+    search as search,
+    blockquote as blockquote,
+    dd as dd,
+    div as div,
+    dl as dl,
+    dt as dt,
+    figcaption as figcaption,
+    figure as figure,
+    hr as hr,
+    li as li,
+    menu as menu,
+    ol as ol,
+    p as p,
+    pre as pre,
+    ul as ul,
+    a as a,
+    abbr as abbr,
+    b as b,
+    bdi as bdi,
+    bdo as bdo,
+    br as br,
+    cite as cite,
+    code as code,
+    data as data,
+    dfn as dfn,
+    em as em,
+    i as i,
+    kbd as kbd,
+    mark as mark,
+    q as q,
+    rp as rp,
+    rt as rt,
+    ruby as ruby,
+    s as s,
+    samp as samp,
+    small as small,
+    span as span,
+    strong as strong,
+    sub as sub,
+    sup as sup,
+    time as time,
+    u as u,
+    var as var,
+    wbr as wbr,
+    area as area,
+    audio as audio,
+    img as img,
+    map as map,
+    track as track,
+    video as video,
+    embed as embed,
+    iframe as iframe,
+    object as object,
+    picture as picture,
+    portal as portal,
+    source as source,
+    svg as svg,
+    math as math,
+    canvas as canvas,
+    noscript as noscript,
+    script as script,
+    _del as _del,
+    ins as ins,
+    caption as caption,
+    col as col,
+    colgroup as colgroup,
+    table as table,
+    tbody as tbody,
+    td as td,
+    tfoot as tfoot,
+    th as th,
+    thead as thead,
+    tr as tr,
+    button as button,
+    datalist as datalist,
+    fieldset as fieldset,
+    form as form,
+    input_ as input_,
+    label as label,
+    legend as legend,
+    meter as meter,
+    optgroup as optgroup,
+    option as option,
+    output as output,
+    progress as progress,
+    select as select,
+    textarea as textarea,
+    details as details,
+    dialog as dialog,
+    summary as summary,
+    slot as slot,
+    template as template,
+    del_ as del_,
+)
@@ -0,0 +1,248 @@
+"""
+Live sessions.
+
+In live mode every browser tab showing a page with server listeners gets a
+`Session` retaining the page's tree on the server. The tab opens a single
+websocket to `LIVE_PATH` and sends its events over it, their listeners update
+the retained tree in place and only the patches are sent back: an event costs
+neither an HTTP request nor a render of the page.
+
+Since sessions keep whole trees alive, `Session.memory` estimates what each of
+them retains and `Sessions.report` sums it up for the server.
+"""
+
+import json
+import secrets
+import sys
+from collections import OrderedDict
+from typing import Any, TypeAlias
+
+from litestar import WebSocket
+from litestar.exceptions import WebSocketDisconnect
+
+from .core.element import _NO_ATTRIBUTES, Element
+from .core.events import registry
+from .core.rendering.diff import Patch, diff, dumps, snapshot
+from .core.traversal import preorder
+
+LIVE_PATH = "/_prymal/live"
+
+MAX_PENDING = 256
+"""Sessions remembered for tabs that haven't connected their socket yet."""
+
+SOCKET_SCRIPT = """
+window.prymalSocket = function (path, session) {
+  const scheme = location.protocol === "https:" ? "wss" : "ws";
+  const socket = new WebSocket(`${scheme}://${location.host}${path}`);
+  const opened = new Promise((resolve) => {
+    socket.onopen = () => {
+      socket.send(session);
+      resolve();
+    };
+  });
+  // Events are sent one batch at a time, each answered with its patches.
+  let answer = null;
+  socket.onmessage = (message) => {
+    if (message.data === "reload") location.reload();
+    else answer(JSON.parse(message.data));
+  };
+  socket.onclose = () => setTimeout(() => location.reload(), 1000);
+  return async (events) => {
+    await opened;
+    return new Promise((resolve) => {
+      answer = resolve;
+      socket.send(JSON.stringify(events));
+    });
+  };
+};
+"""
+"""Defines `prymalSocket(path, session)`, the `prymalEvents` transport of live sessions."""
+
+
+Event: TypeAlias = tuple[int, str, list[dict[str, Any]]]
+"""A browser event: the registry ID of its element, its name and the data of its batch."""
+
+
+def parse_events(message: str | bytes) -> list[Event]:
+    """
+    The events of a message sent by the browser, a JSON list of `[element_id,
+    name, batch]`. Raises `ValueError` when the message is malformed.
+    """
+    events = json.loads(message)
+    if not isinstance(events, list):
+        raise ValueError("Expected a list of events")
+    for event in events:
+        if not (
+            isinstance(event, list)
+            and len(event) == 3
+            and type(event[0]) is int
+            and isinstance(event[1], str)
+            and isinstance(event[2], list)
+            and all(isinstance(data, dict) for data in event[2])
+        ):
+            raise ValueError(f"Malformed event: {event!r}")
+    return [(element_id, name, batch) for element_id, name, batch in events]
+
+
+def _root(element: Element) -> Element:
+    while element.parent is not element:
+        element = element.parent
+    return element
+
+
+async def handle(
+    events: list[Event], *, session: "Session", atomic_styles: bool = False
+) -> list[Patch] | None:
+    """
+    Runs the listeners of a batch of browser events for the page of `session`
+    and returns the patches updating it, computed once for the whole batch.
+    Events of elements outside of its tree are ignored. `None` when no
+    listener ran.
+
+    Listeners must update the tree through the element's methods, such as
+    `set_attribute` or assigning `Text.text`, for the update to be seen.
+    """
+    root = session.root
+    accepted: list[Event] = []
+    for event in events:
+        listeners = registry.get(event[0])
+        if listeners is not None and _root(listeners.element) is root:
+            accepted.append(event)
+    if not accepted:
+        return None
+
+    before = session.snapshot or snapshot(root)
+    dispatched = False
+    for element_id, name, batch in accepted:
+        dispatched = await registry.dispatch(element_id, name, batch) or dispatched
+    if not dispatched:
+        return None
+    patches = diff(before, root, atomic_styles=atomic_styles)
+    session.snapshot = snapshot(root, before)
+    return patches
+
+
+class Session:
+    """
+    A page as it is displayed in one browser tab. `snapshot` is the state of
+    the page the tab was last sent, kept from one event to the next so only
+    the parts of the tree an event updated are copied again.
+    """
+
+    __slots__ = ("id", "root", "snapshot", "socket")
+
+    def __init__(self, root: Element) -> None:
+        self.id = secrets.token_hex(8)
+        self.root = root
+        self.snapshot: Element | None = None
+        self.socket: WebSocket | None = None
+
+    def memory(self) -> int:
+        """
+        Estimated bytes retained by the session: its elements along with their
+        children lists, attributes, text and listeners, and the copies of its
+        snapshot. Styles are interned and shared between sessions, they aren't
+        counted, nor is what the snapshot shares with the tree.
+        """
+        size = sys.getsizeof(self)
+        if self.snapshot is not None:
+            for copy in preorder(self.snapshot):
+                size += sys.getsizeof(copy)
+                if isinstance(copy._children, list):
+                    size += sys.getsizeof(copy._children)
+        for element in preorder(self.root):
+            size += sys.getsizeof(element)
+            if isinstance(element._children, list):
+                size += sys.getsizeof(element._children)
+            attributes = element.attributes
+            if attributes is not _NO_ATTRIBUTES:
+                size += sys.getsizeof(attributes)
+            if element.text:
+                size += sys.getsizeof(element.text) + sum(map(sys.getsizeof, element.text))
+            listeners = element._event_listeners
+            if listeners is not None:
+                size += sys.getsizeof(listeners) + sum(map(sys.getsizeof, listeners.values()))
+            instance_dict = getattr(element, "__dict__", None)
+            if instance_dict is not None:
+                size += sys.getsizeof(instance_dict)
+        return size
+
+
+class Sessions:
+    """
+    The live sessions of an application, keyed by session ID. Sessions whose
+    tab hasn't connected yet are pending, only the `max_pending` most recent
+    of them are kept.
+    """
+
+    def __init__(self, atomic_styles: bool = False, max_pending: int = MAX_PENDING) -> None:
+        self.atomic_styles = atomic_styles
+        self.max_pending = max_pending
+        self.pending: OrderedDict[str, Session] = OrderedDict()
+        self.sessions: dict[str, Session] = {}
+
+    def __len__(self) -> int:
+        return len(self.pending) + len(self.sessions)
+
+    def open(self, root: Element) -> Session:
+        """
+        Starts a session for a page about to be sent to a browser.
+        """
+        session = Session(root)
+        self.pending[session.id] = session
+        if len(self.pending) > self.max_pending:
+            self.pending.popitem(last=False)
+        return session
+
+    def script(self, session: Session) -> str:
+        """
+        Client code connecting the page of `session` to its socket.
+        """
+        path, session_id = json.dumps(LIVE_PATH), json.dumps(session.id)
+        return f"{SOCKET_SCRIPT}prymalSocket({path}, {session_id})"
+
+    async def serve(self, socket: WebSocket) -> None:
+        """
+        Websocket handler: the first message names the session, every other one
+        is a batch of events answered with its patches.
+        """
+        await socket.accept()
+        session = self.pending.pop(await socket.receive_text(), None)
+        if session is None:
+            await socket.send_text("reload")
+            await socket.close()
+            return
+
+        session.socket = socket
+        self.sessions[session.id] = session
+        try:
+            while True:
+                try:
+                    events = parse_events(await socket.receive_text())
+                except ValueError:
+                    # The tab waits for an answer to every message it sends.
+                    await socket.send_text("[]")
+                    continue
+                patches = await handle(events, session=session, atomic_styles=self.atomic_styles)
+                await socket.send_text(dumps(patches or []))
+        except WebSocketDisconnect:
+            pass
+        finally:
+            self.sessions.pop(session.id, None)
+
+    def report(self) -> dict[str, int]:
+        """
+        Number of sessions, connected ones and the bytes they retain, see
+        `Session.memory`.
+        """
+        sizes = [
+            session.memory()
+            for sessions in (self.pending, self.sessions)
+            for session in sessions.values()
+        ]
+        return {
+            "sessions": len(sizes),
+            "connected": len(self.sessions),
+            "bytes": sum(sizes),
+            "bytes_per_session": sum(sizes) // len(sizes) if sizes else 0,
+        }
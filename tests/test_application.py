@@ -0,0 +1,99 @@
+import json
+import re
+from collections.abc import Iterator
+
+import pytest
+from litestar import Litestar
+from litestar.testing import TestClient
+
+from prymal.application import EVENTS_PATH, Application
+from prymal.core.element import Element
+from prymal.core.rendering.diff import PatchOp
+from prymal.elements import Text
+from prymal.html.html_tags import body, button, head, html, p
+
+state = {"greeting": "Hello"}
+
+
+def static_page() -> Element:
+    return html()(head(), body()(p()(Text(state["greeting"]))))
+
+
+def counter_page() -> Element:
+    label = Text("0")
+
+    def clicked(event: object) -> None:
+        label.text = (str(int(label.text[0]) + 1),)
+
+    return html()(head(), body()(button().add_event_listener("click", clicked), p()(label)))
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient[Litestar]]:
+    app = Application(etags=True, compression=None)
+    app.mount("/", static_page)
+    app.mount("/counter", counter_page)
+    with TestClient(app.asgi) as client:
+        yield client
+    state["greeting"] = "Hello"
+
+
+def test_pages_are_full_documents(client: TestClient[Litestar]) -> None:
+    response = client.get("/")
+    assert response.status_code == 200
+    assert (
+        response.text == "<!DOCTYPE html><html><head></head><body><p><p>Hello</p></p></body></html>"
+    )
+
+
+def test_etag_validation(client: TestClient[Litestar]) -> None:
+    tag = client.get("/").headers["etag"]
+    assert tag.startswith('W/"')
+
+    response = client.get("/", headers={"if-none-match": tag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert client.get("/", headers={"if-none-match": tag.removeprefix("W/")}).status_code == 304
+    assert client.get("/", headers={"if-none-match": f'"other", {tag}'}).status_code == 304
+    assert client.get("/", headers={"if-none-match": "*"}).status_code == 304
+
+    state["greeting"] = "Bonjour"
+    response = client.get("/", headers={"if-none-match": tag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != tag
+    assert "Bonjour" in response.text
+
+
+def test_no_etags_by_default() -> None:
+    app = Application(compression=None)
+    app.mount("/", static_page)
+    with TestClient(app.asgi) as client:
+        assert "etag" not in client.get("/").headers
+
+
+def events_path(client: TestClient[Litestar]) -> tuple[str, int]:
+    page = client.get("/counter").text
+    path = re.search(r'prymalPost\("([^"]+)"\)', page)
+    element_id = re.search(r'data-prymal-id="(\d+)"', page)
+    assert path is not None and element_id is not None
+    return path[1], int(element_id[1])
+
+
+def test_events_are_answered_with_patches(client: TestClient[Litestar]) -> None:
+    path, element_id = events_path(client)
+    assert path.startswith(f"{EVENTS_PATH}/")
+    for expected in ("1", "2"):
+        response = client.post(path, content=json.dumps([[element_id, "click", [{}]]]))
+        assert response.status_code == 200
+        assert response.json() == [[PatchOp.SetText, [1, 1, 0], expected]]
+
+
+def test_events_errors(client: TestClient[Litestar]) -> None:
+    path, element_id = events_path(client)
+    other_path, other_id = events_path(client)
+    event = json.dumps([[element_id, "click", [{}]]])
+    assert client.post(f"{EVENTS_PATH}/unknown", content=event).status_code == 404
+    # A page only reaches its own elements.
+    assert client.post(other_path, content=event).status_code == 404
+    assert client.post(path, content=b"{").status_code == 400
+    assert client.post(path, content=b'[["1", "click", []]]').status_code == 400
@@ -0,0 +1,35 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from prymal.core.element import Element
+from prymal.core.rendering.batch import _in_flight, render_batch, render_pages
+from prymal.core.rendering.web_renderer import render_to_string
+from prymal.core.style import Style
+from prymal.elements import Text
+from prymal.html.html_tags import li, ul
+
+
+def report(rows: int) -> Element:
+    bold = Style(font_weight="bold")
+    return ul()(
+        *(li(bold if index % 2 else Style())(Text(f"Row {index}")) for index in range(rows))
+    )
+
+
+def test_pages_render_in_order() -> None:
+    expected = [render_to_string(report(rows), cache=None) for rows in range(8)]
+    with ProcessPoolExecutor(2) as executor:
+        rendered = list(render_pages(report, [(rows,) for rows in range(8)], executor=executor))
+    assert rendered == expected
+
+
+def test_trees_render_in_order() -> None:
+    documents = [report(rows) for rows in range(8)]
+    expected = [render_to_string(document, cache=None).encode() for document in documents]
+    with ThreadPoolExecutor(2) as executor:
+        rendered = list(render_batch(documents, executor=executor, encoding="utf-8"))
+    assert rendered == expected
+
+
+def test_in_flight_follows_the_executor() -> None:
+    with ThreadPoolExecutor(3) as executor:
+        assert _in_flight(executor) == 12
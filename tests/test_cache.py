@@ -0,0 +1,82 @@
+from collections.abc import Hashable
+
+from prymal.component import Component
+from prymal.core.element import Element
+from prymal.core.rendering.cache import Fragment, FragmentCache
+from prymal.core.rendering.web_renderer import render_to_string
+from prymal.core.style import Style, StyleProperty
+from prymal.elements import Text
+from prymal.html.html_tags import a, body, div, head, html, li, nav, ul
+
+
+class Nav(Component):
+    memoized = True
+
+    def cache_key(self) -> Hashable:
+        return "nav"
+
+    def render(self) -> Element:
+        return nav(Style(StyleProperty("color", "red")))(a(href="/"))
+
+
+class Forgetful(FragmentCache):
+    """
+    Evicts every entry right after it was first found, as another request
+    rendering meanwhile could.
+    """
+
+    def get(self, key: Hashable) -> Fragment | None:
+        fragment = super().get(key)
+        if fragment is not None:
+            self.clear()
+        return fragment
+
+
+def page() -> Element:
+    return html()(head(), body()(Nav()))
+
+
+def test_fragment_evicted_during_render_is_still_spliced() -> None:
+    cache = Forgetful()
+    expected = render_to_string(page(), cache=cache)
+    assert len(cache) == 1
+
+    rendered = render_to_string(page(), cache=cache)
+    assert len(cache) == 0
+    assert rendered == expected
+    assert "<nav" in rendered and "color:red" in rendered
+
+
+def test_least_recently_used_fragments_are_evicted() -> None:
+    cache = FragmentCache(max_bytes=10)
+    cache.put("a", "aaaa", ())
+    cache.put("b", "bbbb", ())
+    assert cache.get("a") is not None
+    cache.put("c", "cccc", ())
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.size == 8
+
+    cache.put("a", "é", ())
+    assert cache.size == 6
+    cache.put("huge", "x" * 11, ())
+    assert "huge" not in cache and len(cache) == 2
+
+
+def test_updated_subtrees_miss_the_cache() -> None:
+    cache = FragmentCache()
+    items = ul()(li()(Text("first")))
+    tree = div()(items.memoize())
+    assert "first" in render_to_string(tree, cache=cache)
+    assert len(cache) == 1
+
+    items(li()(Text("second")))
+    rendered = render_to_string(tree, cache=cache)
+    assert "first" in rendered and "second" in rendered
+    assert len(cache) == 2
+
+
+def test_keyed_fragments_are_shared() -> None:
+    cache = FragmentCache()
+    render_to_string(div()(div().memoize("shared")(Text("first"))), cache=cache)
+    rendered = render_to_string(div()(div().memoize("shared")(Text("second"))), cache=cache)
+    assert "first" in rendered and "second" not in rendered
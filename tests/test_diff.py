@@ -0,0 +1,272 @@
+import random
+from html.parser import HTMLParser
+from typing import Any
+
+import pytest
+
+from prymal.core.element import VOID_ELEMENTS, Element
+from prymal.core.rendering.diff import PatchOp, _longest_increasing, diff, snapshot
+from prymal.core.rendering.web_renderer import render_to_string
+from prymal.core.style import Style, StyleProperty
+from prymal.elements import Text
+from prymal.html.html_tags import div, li, p, span, ul
+
+
+class Node:
+    """
+    A DOM node as `PATCH_SCRIPT` sees it: tag, attributes, leading text and
+    element children.
+    """
+
+    def __init__(self, tag: str, attributes: dict[str, str]) -> None:
+        self.tag = tag
+        self.attributes = attributes
+        self.text = ""
+        self.children: list[Node] = []
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Node) and vars(self) == vars(other)
+
+    def __repr__(self) -> str:
+        return f"Node({self.tag!r}, {self.attributes!r}, {self.text!r}, {self.children!r})"
+
+
+class _Parser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.root = Node("#mount", {})
+        self.stack = [self.root]
+        self.in_style = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "style":
+            self.in_style = True
+            return
+        node = Node(tag, {name: value or "" for name, value in attrs})
+        self.stack[-1].children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(node)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "style":
+            self.in_style = False
+        elif tag not in VOID_ELEMENTS:
+            self.stack.pop()
+
+    def handle_data(self, data: str) -> None:
+        parent = self.stack[-1]
+        if not self.in_style and not parent.children:
+            parent.text += data
+
+
+def parse(html: str) -> Node:
+    parser = _Parser()
+    parser.feed(html)
+    return parser.root
+
+
+def apply(mount: Node, patches: list[Any]) -> Node:
+    """
+    Applies patches the way `PATCH_SCRIPT` does.
+    """
+
+    def at(path: tuple[int, ...]) -> Node:
+        node = mount.children[0]
+        for index in path:
+            node = node.children[index]
+        return node
+
+    def siblings_of(path: tuple[int, ...]) -> tuple[list[Node], int]:
+        # By position: nodes compare equal to their identical siblings.
+        if not path:
+            return mount.children, 0
+        return at(path[:-1]).children, path[-1]
+
+    for op, *args in patches:
+        if op == PatchOp.Insert:
+            at(args[0]).children.insert(args[1], parse(args[2]).children[0])
+        elif op == PatchOp.Remove:
+            siblings, index = siblings_of(args[0])
+            del siblings[index]
+        elif op == PatchOp.Move:
+            children = at(args[0]).children
+            children.insert(args[2], children.pop(args[1]))
+        elif op == PatchOp.Replace:
+            siblings, index = siblings_of(args[0])
+            siblings[index] = parse(args[1]).children[0]
+        elif op == PatchOp.SetText:
+            at(args[0]).text = args[1]
+        elif op == PatchOp.SetAttribute:
+            attributes = at(args[0]).attributes
+            if args[2] is None:
+                attributes.pop(args[1], None)
+            else:
+                attributes[args[1]] = args[2]
+        elif op == PatchOp.ChangeClass:
+            attributes = at(args[0]).attributes
+            if args[1] is None:
+                attributes.pop("class", None)
+            else:
+                attributes["class"] = args[1]
+    return mount
+
+
+def assert_patches(old: Element, new: Element) -> list[Any]:
+    patches = diff(old, new)
+    assert apply(parse(render_to_string(old)), patches) == parse(render_to_string(new))
+    return patches
+
+
+def keyed_list(keys: list[int]) -> Element:
+    root = ul()
+    for key in keys:
+        item = li(id=f"item-{key}")
+        item.key = key
+        root(item)
+    return root
+
+
+def test_identical_trees_have_no_patches() -> None:
+    assert diff(keyed_list([1, 2, 3]), keyed_list([1, 2, 3])) == []
+
+
+def test_text_attributes_and_classes() -> None:
+    red = Style(StyleProperty("color", "red"))
+    old = div(id="a", title="t")(p()(Text("before")), span(hidden=True))
+    new = div(red, id="b")(p()(Text("after")), span(hidden=False))
+    assert_patches(old, new)
+
+
+def test_replaces_a_changed_root() -> None:
+    patches = assert_patches(div()(p()), span()(p()))
+    assert [patch[0] for patch in patches] == [PatchOp.Replace]
+
+
+def test_children_of_another_tag_are_inserted() -> None:
+    patches = assert_patches(div()(p(), span()), div()(p(), div()))
+    assert [patch[0] for patch in patches] == [PatchOp.Remove, PatchOp.Insert]
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        ([1, 2, 3, 4], [4, 3, 2, 1]),
+        ([1, 2, 3, 4], [2, 3, 4, 1]),
+        ([1, 2, 3, 4], [4, 1, 2, 3]),
+        ([1, 2, 3], [5, 3, 1, 6, 2]),
+        ([1, 2, 3, 4, 5], [1, 5]),
+        ([], [1, 2]),
+        ([1, 2], []),
+    ],
+)
+def test_keyed_reorders(old: list[int], new: list[int]) -> None:
+    assert_patches(keyed_list(old), keyed_list(new))
+
+
+def test_keyed_moves_keep_the_longest_stable_run() -> None:
+    patches = assert_patches(keyed_list([1, 2, 3, 4, 5]), keyed_list([5, 1, 2, 3, 4]))
+    assert patches == [(PatchOp.Move, (), 4, 0)]
+
+
+def test_random_keyed_reorders() -> None:
+    generator = random.Random(0)
+    for _ in range(200):
+        old = generator.sample(range(40), generator.randint(0, 20))
+        new = generator.sample(range(40), generator.randint(0, 20))
+        assert_patches(keyed_list(old), keyed_list(new))
+
+
+def mixed_list(generator: random.Random, keys: list[int]) -> Element:
+    root = ul()
+    for key in keys:
+        if generator.random() < 0.4:
+            # Unkeyed, often identical to a sibling.
+            tag = generator.choice((p, span))
+            root(tag(title=str(generator.randrange(3)))(Text(str(generator.randrange(2)))))
+        else:
+            item = li(id=f"item-{key}")(Text(str(generator.randrange(2))))
+            item.key = key
+            root(item)
+    return root
+
+
+def test_random_mixed_children() -> None:
+    generator = random.Random(0)
+    for _ in range(3000):
+        old = generator.sample(range(12), generator.randint(0, 8))
+        new = generator.sample(range(12), generator.randint(0, 8))
+        assert_patches(mixed_list(generator, old), mixed_list(generator, new))
+
+
+def test_deep_trees_have_short_lived_paths() -> None:
+    def chain(depth: int, text: str) -> Element:
+        root = leaf = div()
+        for _ in range(depth):
+            child = div()
+            leaf(child)
+            leaf = child
+        leaf(Text(text))
+        return root
+
+    patches = diff(chain(50_000, "old"), chain(50_000, "new"))
+    assert patches == [(PatchOp.SetText, (0,) * 50_001, "new")]
+
+
+def test_unkeyed_children_match_by_tag() -> None:
+    old = div()(p(id="1"), span(id="2"), p(id="3"))
+    new = div()(span(id="2"), p(id="1"), p(id="4"), p(id="3"))
+    assert_patches(old, new)
+
+
+def test_snapshot_sees_updates_in_place() -> None:
+    root = keyed_list([1, 2, 3])
+    before = snapshot(root)
+    items = list(root.children)
+    root.clear_children()
+    root(items[2], items[0], li(id="new"))
+    patches = diff(before, root)
+    assert apply(parse(render_to_string(before)), patches) == parse(render_to_string(root))
+
+
+def test_setters_invalidate_digests() -> None:
+    label = Text("before")
+    link = div(title="t")(label)
+    root = div()(link, p()(Text("same")))
+    before = snapshot(root)
+    label.text = ("after",)
+    link.set_attribute("title", "u").set_attribute("hidden", True)
+    patches = assert_patches(before, root)
+    assert {patch[0] for patch in patches} == {PatchOp.SetText, PatchOp.SetAttribute}
+
+
+def test_snapshot_shares_unchanged_subtrees() -> None:
+    label = Text("before")
+    root = div()(p()(label), keyed_list([1, 2, 3]))
+    first = snapshot(root)
+    assert snapshot(root, first) is first
+
+    label.text = ("after",)
+    second = snapshot(root, first)
+    assert second._children[1] is first._children[1]
+    assert second._children[0] is not first._children[0]
+    assert second._children[0].digest == root._children[0].digest
+    assert render_to_string(second) == render_to_string(root)
+    assert render_to_string(first) != render_to_string(root)
+
+
+@pytest.mark.parametrize(
+    "sequence",
+    [[], [3], [1, 2, 3], [3, 2, 1], [2, 5, 3, 7, 11, 8, 10, 13, 6], [0, 8, 4, 12, 2, 10, 6, 14]],
+)
+def test_longest_increasing(sequence: list[int]) -> None:
+    stable = _longest_increasing(sequence)
+    subsequence = [value for value in sequence if value in stable]
+    assert subsequence == sorted(subsequence)
+
+    # Longest by brute force over the lengths ending at each value.
+    lengths = [1] * len(sequence)
+    for end in range(len(sequence)):
+        for start in range(end):
+            if sequence[start] < sequence[end]:
+                lengths[end] = max(lengths[end], lengths[start] + 1)
+    assert len(stable) == max(lengths, default=0)
@@ -0,0 +1,29 @@
+import subprocess
+import sys
+
+from benchmarks.imports import import_time
+
+STATEMENT = "from prymal.html import div"
+BUDGET_MS = 10.0
+
+
+def test_import_time_budget() -> None:
+    # Byte code is compiled by the first run, cold starts in production don't.
+    subprocess.run([sys.executable, "-c", STATEMENT], check=True)
+    best, lines = min(import_time(STATEMENT) for _ in range(5))
+    assert best <= BUDGET_MS * 1000, "\n".join(lines)
+
+
+def test_no_heavy_modules_imported() -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {STATEMENT}; print(' '.join(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules = set(result.stdout.split())
+    assert not modules & {"hashlib", "_hashlib", "litestar", "asyncio"}
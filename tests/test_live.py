@@ -0,0 +1,35 @@
+import asyncio
+
+from prymal.core.element import Element
+from prymal.core.rendering.diff import PatchOp
+from prymal.elements import Container, Text
+from prymal.html.html_tags import button, p
+from prymal.live import Session, handle
+
+
+def counter_page() -> tuple[Element, Text]:
+    count = Text("0")
+
+    def clicked(event: object) -> None:
+        count.text = (str(int(count.text[0]) + 1),)
+
+    root = Container()(button().add_event_listener("click", clicked), p()(count))
+    return root, count
+
+
+def test_events_are_answered_with_their_patches() -> None:
+    root, count = counter_page()
+    session = Session(root)
+    button_id = root._children[0]._event_listeners.id  # type: ignore[union-attr]
+    for expected in ("1", "2"):
+        patches = asyncio.run(handle([(button_id, "click", [{}])], session=session))
+        assert patches == [(PatchOp.SetText, (1, 0), expected)]
+    assert count.text == ("2",)
+    assert session.snapshot is not None and session.snapshot.digest == root.digest
+
+
+def test_events_of_other_pages_are_ignored() -> None:
+    root, _ = counter_page()
+    other, _ = counter_page()
+    button_id = other._children[0]._event_listeners.id  # type: ignore[union-attr]
+    assert asyncio.run(handle([(button_id, "click", [{}])], session=Session(root))) is None
@@ -0,0 +1,102 @@
+import random
+
+from prymal.core.persistent import SMALL_SIZE, PersistentMap
+
+
+class Key:
+    """
+    A key with a chosen hash, to build collisions.
+    """
+
+    def __init__(self, name: str, hash: int) -> None:
+        self.name = name
+        self.hash = hash
+
+    def __hash__(self) -> int:
+        return self.hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Key) and self.name == other.name
+
+    def __repr__(self) -> str:
+        return f"Key({self.name!r})"
+
+
+def test_small_and_trie_maps_match_dict() -> None:
+    generator = random.Random(0)
+    expected: dict[int, int] = {}
+    current: PersistentMap[int, int] = PersistentMap()
+    for step in range(2000):
+        key = generator.randrange(300)
+        expected[key] = step
+        current = current.set(key, step)
+        assert len(current) == len(expected)
+    assert list(current.items()) == list(expected.items())
+    assert all(current[key] == value for key, value in expected.items())
+
+
+def test_iteration_follows_insertion_order() -> None:
+    keys = [f"key-{index}" for index in range(SMALL_SIZE * 8)]
+    mapping = PersistentMap((key, index) for index, key in enumerate(keys))
+    assert list(mapping) == keys
+
+    # Replacing a value keeps the key's place.
+    replaced = mapping.set(keys[3], "replaced")
+    assert list(replaced) == keys
+    assert replaced[keys[3]] == "replaced"
+    assert list(replaced.values())[3] == "replaced"
+
+
+def test_updates_leave_the_original_untouched() -> None:
+    original = PersistentMap((index, index) for index in range(100))
+    updated = original.set(5, "five").update({200: 200})
+    assert original[5] == 5 and 200 not in original and len(original) == 100
+    assert updated[5] == "five" and updated[200] == 200 and len(updated) == 101
+
+
+def test_full_hash_collisions() -> None:
+    keys = [Key(f"key-{index}", 42) for index in range(SMALL_SIZE * 2)]
+    mapping = PersistentMap((key, index) for index, key in enumerate(keys))
+    assert len(mapping) == len(keys)
+    assert [mapping[key] for key in keys] == list(range(len(keys)))
+    assert list(mapping) == keys
+
+    mapping = mapping.set(keys[1], "replaced").set(Key("other", 43), "other")
+    assert mapping[Key("key-1", 42)] == "replaced"
+    assert mapping[Key("other", 43)] == "other"
+    assert Key("missing", 42) not in mapping
+    assert list(mapping)[:2] == keys[:2]
+
+
+def test_partial_hash_collisions() -> None:
+    # Hashes sharing their lowest bits end up in nodes several levels deep.
+    keys = [Key(f"key-{index}", index << 40 | 7) for index in range(SMALL_SIZE * 4)]
+    keys.append(Key("colliding", keys[-1].hash))
+    mapping = PersistentMap((key, key.name) for key in keys)
+    assert len(mapping) == len(keys)
+    assert all(mapping[key] == key.name for key in keys)
+    assert list(mapping) == keys
+
+
+def test_branching_versions_stay_independent() -> None:
+    generator = random.Random(1)
+    versions: list[tuple[PersistentMap[int, int], dict[int, int]]] = [(PersistentMap(), {})]
+    for step in range(1500):
+        mapping, expected = generator.choice(versions)
+        key = generator.randrange(200)
+        versions.append((mapping.set(key, step), {**expected, key: step}))
+    for mapping, expected in versions:
+        assert len(mapping) == len(expected)
+        assert list(mapping.items()) == list(expected.items())
+
+
+def test_update_shares_maps() -> None:
+    empty: PersistentMap[str, int] = PersistentMap()
+    other = PersistentMap([("a", 1), ("b", 2)])
+    assert empty.update(other) is other
+    assert other.update({}) is other
+    assert list(other.update(PersistentMap([("c", 3), ("a", 4)])).items()) == [
+        ("a", 4),
+        ("b", 2),
+        ("c", 3),
+    ]
@@ -0,0 +1,147 @@
+import asyncio
+import random
+from html import escape as html_escape
+from typing import Any
+
+import pytest
+
+from prymal.component import Component
+from prymal.core.element import Element
+from prymal.core.rendering.escaping import Markup, escape
+from prymal.core.rendering.template import compiled
+from prymal.core.rendering.web_renderer import render, render_async, render_to_string
+from prymal.core.style import Style, StyleProperty
+from prymal.elements import Text
+from prymal.html.html_tags import a, body, div, head, html, input_, li, p, ul
+
+red = Style(StyleProperty("color", "red"))
+
+
+def document() -> Element:
+    return html()(
+        head(),
+        body()(div(red, id="x")(Text("a<b")), input_(disabled=True, hidden=False, value=None)),
+    )
+
+
+def test_render_to_string() -> None:
+    css_class = render_to_string(div(red), cache=None).split('"')[1]
+    assert render_to_string(document(), cache=None) == (
+        f"<html><head><style>.{css_class}{{color:red}}</style></head><body>"
+        f'<div id="x" class="{css_class}"><p>a&lt;b</p></div><input disabled></body></html>'
+    )
+
+
+def test_styles_follow_a_root_without_head() -> None:
+    rendered = render_to_string(div(red)(Text("x")), cache=None)
+    assert rendered.startswith("<div class=") and rendered.endswith("{color:red}</style>")
+
+
+def test_pretty_output() -> None:
+    assert render_to_string(ul()(li(), li()(Text("x"))), pretty=True, indent=1, cache=None) == (
+        "<ul>\n <li></li>\n <li>\n  <p>x</p>\n </li>\n</ul>"
+    )
+
+
+def test_chunks_join_into_the_string() -> None:
+    tree = ul()(*(li(red, id=str(index))(Text(f"item {index}")) for index in range(500)))
+    expected = render_to_string(tree, cache=None)
+    chunks = list(render(tree, chunk_size=1000, cache=None))
+    assert "".join(chunks) == expected
+    assert len(chunks) > 1
+    assert all(len(chunk) >= 1000 for chunk in chunks[:-1])
+
+    encoded = list(render(tree, encoding="utf-8", chunk_size=1000, cache=None))
+    assert b"".join(encoded) == expected.encode()
+
+
+@compiled
+def card(title: str, href: str | None, hidden: bool) -> Element:
+    return div(class_="card", hidden=hidden)(a(href=href)(Text(title)))
+
+
+def uncompiled(title: str, href: str | None, hidden: bool) -> Element:
+    return div(class_="card", hidden=hidden)(a(href=href)(Text(title)))
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [("T&", "/x", True), ("U", None, False), ("<i>", "/a?b=1&c=2", False)],
+)
+def test_compiled_templates_render_like_the_function(arguments: tuple[Any, ...]) -> None:
+    rendered = render_to_string(div()(card(*arguments)), cache=None)
+    assert rendered == render_to_string(div()(uncompiled(*arguments)), cache=None)
+
+
+def test_compiled_templates_escape_quotes() -> None:
+    # A slot may end up in part of an attribute value, quotes are always
+    # escaped.
+    rendered = render_to_string(card('"quoted"', '"/"', False), cache=None)
+    assert (
+        rendered == '<div class="card"><a href="&quot;/&quot;"><p>&quot;quoted&quot;</p></a></div>'
+    )
+
+
+def test_compiled_templates_keep_markup() -> None:
+    rendered = render_to_string(card(Markup("<b>bold</b>"), "/", False), cache=None)
+    assert "<b>bold</b>" in rendered
+
+
+class Slow(Component):
+    deferred = True
+
+    async def load(self) -> None:
+        await asyncio.sleep(0.01)
+        self.value = "loaded"
+
+    def fallback(self) -> Element:
+        return Text("loading")
+
+    def render(self) -> Element:
+        return div(red)(Text(self.value))
+
+
+class Broken(Slow):
+    async def load(self) -> None:
+        raise RuntimeError("unavailable")
+
+
+async def chunks(element: Element) -> list[str]:
+    return [chunk async for chunk in render_async(element, cache=None)]
+
+
+def test_deferred_components_stream_behind_placeholders() -> None:
+    page, swap, content = asyncio.run(chunks(div()(Slow())))
+    assert (
+        page == '<div><prymal-placeholder id="prymal-0"><p>loading</p></prymal-placeholder></div>'
+    )
+    assert "prymalSwap" in swap
+    assert content.startswith('<template id="prymal-0-content"><style>')
+    assert "<p>loaded</p></div></template>" in content
+    assert content.endswith('<script>prymalSwap("prymal-0")</script>')
+
+
+def test_failed_loads_keep_their_fallback() -> None:
+    page, _, content = asyncio.run(chunks(div()(Broken(), p())))
+    assert page.endswith("</prymal-placeholder><p></p></div>")
+    assert content == (
+        '<template id="prymal-0-content"><p>loading</p></template>'
+        '<script>prymalSwap("prymal-0")</script>'
+    )
+
+
+@pytest.mark.parametrize("quote", [True, False])
+def test_escape_matches_html_escape(quote: bool) -> None:
+    generator = random.Random(0)
+    alphabet = "&<>\"'ab é\x00;#"
+    for _ in range(500):
+        value = "".join(generator.choices(alphabet, k=generator.randint(0, 12)))
+        assert escape(value, quote) == html_escape(value, quote)
+
+
+def test_escape_values() -> None:
+    plain = "nothing to escape"
+    assert escape(plain) is plain
+    assert escape(42) == "42"
+    assert escape(Markup("<b>")) == "<b>"
+    assert Markup.escape("<b>") == Markup("&lt;b&gt;")
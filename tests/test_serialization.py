@@ -0,0 +1,137 @@
+import random
+
+import pytest
+
+from prymal.core.element import _NO_ATTRIBUTES, Element
+from prymal.core.rendering.template import compiled
+from prymal.core.rendering.web_renderer import render_to_string
+from prymal.core.serialization import VERSION, dumps, loads, register
+from prymal.core.style import Style, StyleProperty
+from prymal.core.traversal import preorder
+from prymal.elements import Container, Text
+from prymal.html.html_tags import a, div, input_, li, ul
+
+
+@register
+@compiled
+def card(title: str, href: str) -> Element:
+    return div(class_="card")(a(href=href)(Text(title)))
+
+
+@register
+class Badge(Element):
+    __slots__ = ()
+    tag_name = "span"
+
+
+class Unregistered(Element):
+    __slots__ = ()
+
+
+def page() -> Element:
+    bold = Style(StyleProperty("font-weight", "bold"))
+    items = ul()
+    for index in range(20):
+        item = li(bold, id=f"item-{index}")(Text(f"Item {index}", "é"))
+        item.key = index if index % 2 else f"key-{index}"
+        items(item)
+    return Container()(
+        items,
+        input_(disabled=True, hidden=False, value=None, maxlength=3, step=0.5),
+        div().memoize(),
+        card("Title", "/somewhere"),
+        Badge(),
+    )
+
+
+def test_round_trip_renders_the_same() -> None:
+    tree = page()
+    assert render_to_string(loads(dumps(tree)), cache=None) == render_to_string(tree, cache=None)
+
+
+def test_round_trip_keeps_fields() -> None:
+    tree = loads(dumps(page()))
+    items, field, memoized, _, badge = tree.children
+    first, second = list(items.children)[:2]
+    assert (first.key, second.key) == ("key-0", 1)
+    assert next(iter(first.children)).text == ("Item 0", "é")
+    assert first.style.key == (("font-weight", "bold"),)
+    assert field.attributes == {
+        "disabled": True,
+        "hidden": False,
+        "value": None,
+        "maxlength": 3,
+        "step": 0.5,
+    }
+    assert memoized._memoize is True
+    assert memoized.attributes is _NO_ATTRIBUTES
+    assert first.parent is items and tree.parent is tree
+    assert type(badge) is Badge
+
+
+def test_round_trip_keeps_client_listeners() -> None:
+    tree = div().add_event_listener("click", "alert(1)")
+    server = div().add_event_listener("click", lambda event: None)
+    assert render_to_string(loads(dumps(tree))) == render_to_string(tree)
+    assert "onclick" not in render_to_string(loads(dumps(server)))
+
+
+def test_rejects_foreign_data() -> None:
+    with pytest.raises(ValueError):
+        loads(b"not a tree")
+    data = dumps(div())
+    with pytest.raises(ValueError):
+        loads(data[:4] + bytes((VERSION + 1,)) + data[5:])
+
+
+def test_only_registered_classes_are_decoded() -> None:
+    with pytest.raises(ValueError, match="isn't registered"):
+        loads(dumps(div()(Unregistered())))
+
+    # A class named by the data is never imported.
+    data = dumps(div()(Unregistered()))
+    name = b"tests.test_serialization:Unregistered"
+    forged = data.replace(name, b"subprocess:Popen".ljust(len(name), b" "))
+    with pytest.raises(ValueError, match="isn't registered"):
+        loads(forged)
+
+    with pytest.raises(TypeError):
+        register(dict)  # type: ignore[type-var]
+
+
+def shape(element: Element) -> tuple[object, ...]:
+    return (element.tag_name, element.text, tuple(shape(child) for child in element.children))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_round_trip_keeps_the_shape_of_the_tree(seed: int) -> None:
+    generator = random.Random(seed)
+    tree = div()
+    elements = [tree]
+    for index in range(generator.randint(1, 60)):
+        child = li()(Text(str(index))) if generator.random() < 0.5 else ul()
+        generator.choice(elements)(child)
+        elements.append(child)
+    decoded = loads(dumps(tree))
+    assert shape(decoded) == shape(tree)
+    for element in preorder(decoded):
+        assert all(child.parent is element for child in element.children)
+
+
+def test_round_trip_of_a_deep_tree() -> None:
+    tree = leaf = div()
+    for _ in range(10_000):
+        child = div()
+        leaf(child)
+        leaf = child
+    leaf(Text("bottom"))
+    assert render_to_string(loads(dumps(tree)), cache=None) == render_to_string(tree, cache=None)
+
+
+def test_decoded_text_can_be_updated() -> None:
+    tree = loads(dumps(div()(Text("before"))))
+    text = next(iter(tree.children))
+    digest = tree.digest
+    text.text = ("after",)  # type: ignore[misc]
+    assert tree.digest != digest
+    assert "after" in render_to_string(tree, cache=None)
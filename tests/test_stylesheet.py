@@ -0,0 +1,112 @@
+import pytest
+
+from prymal.core.rendering.stylesheet import StyleSheet
+from prymal.core.style import Style, StyleProperty
+from prymal.html.html_tags import body, div, head, html
+
+
+def rule(style: Style, atomic: bool = False) -> str:
+    stylesheet = StyleSheet(atomic)
+    stylesheet.class_for(style)
+    return stylesheet.css()
+
+
+def test_same_declarations_share_a_class() -> None:
+    stylesheet = StyleSheet()
+    first = stylesheet.class_for(Style(color="red", margin="0"))
+    assert first is not None
+    assert stylesheet.class_for(Style(color="red") & Style(margin="0")) == first
+    assert stylesheet.class_for(Style()) is None
+    assert len(stylesheet) == 1
+
+
+@pytest.mark.parametrize("atomic", [False, True])
+def test_declarations_keep_their_order(atomic: bool) -> None:
+    longhand_last = Style(margin="0", margin_top="5px")
+    shorthand_last = Style(margin_top="5px", margin="0")
+    assert longhand_last.intern() is not shorthand_last.intern()
+    assert rule(longhand_last, atomic).endswith("{margin:0;margin-top:5px}")
+    assert rule(shorthand_last, atomic).endswith("{margin-top:5px;margin:0}")
+
+
+def test_properties_set_again_move_last() -> None:
+    style = Style(margin_top="5px", color="red") & Style(margin="0") & Style(margin_top="1px")
+    assert style.key == (("color", "red"), ("margin", "0"), ("margin-top", "1px"))
+    repeated = Style(StyleProperty("margin-top", "5px"), margin="0", margin_top="1px")
+    assert repeated.key == (
+        ("margin", "0"),
+        ("margin-top", "1px"),
+    )
+
+
+def test_atomic_classes() -> None:
+    stylesheet = StyleSheet(atomic=True)
+    classes = stylesheet.class_for(Style(color="red", padding="1px"))
+    assert classes is not None and len(classes.split()) == 2
+    assert stylesheet.class_for(Style(color="red")) == classes.split()[0]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        'url("data:image/png;base64,iVBO{R}")',
+        "url(data:image/png;base64,iVBORw0KGgo=)",
+        "URL('a;b')",
+        '"a;b"',
+        "'{'",
+        '"\\";"',
+        "calc(100% - 1px)",
+    ],
+)
+def test_valid_values_with_special_characters(value: str) -> None:
+    assert value.replace("<", "\\3c ") in rule(Style(content=value))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "red}</style><script>alert(1)</script><style>",
+        "red;color:blue",
+        "red{",
+        '"unclosed',
+        "url(unclosed",
+        "red\\",
+        '"a\nb"',
+    ],
+)
+def test_values_escaping_their_rule_are_rejected(value: str) -> None:
+    with pytest.raises(ValueError):
+        rule(Style(color=value))
+
+
+def test_invalid_names_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        rule(Style(StyleProperty("color:red;x", "1")))
+    assert "--brand-color:red" in rule(Style(StyleProperty("--brand-color", "red")))
+
+
+def test_less_than_is_escaped() -> None:
+    assert "<" not in rule(Style(content='"</style>"'))
+
+
+def test_collect_finds_styles_and_head() -> None:
+    red = Style(color="red")
+    top = head()
+    stylesheet = StyleSheet().collect(html()(top, body()(div(red), div(red & Style(margin="0")))))
+    assert stylesheet.head is top
+    assert len(stylesheet) == 2
+    assert stylesheet.render() == f"<style>{stylesheet.css()}</style>"
+    assert StyleSheet().render() == ""
+
+
+def test_known_rules_are_left_out() -> None:
+    sent = StyleSheet()
+    sent.class_for(Style(color="red"))
+    fragment = StyleSheet()
+    fragment.class_for(Style(color="red"))
+    fragment.class_for(Style(color="blue"))
+    assert fragment.css(known=sent).endswith("{color:blue}")
+    assert "red" not in fragment.css(known=sent)
+
+    sent.update(fragment)
+    assert fragment.css(known=sent) == ""